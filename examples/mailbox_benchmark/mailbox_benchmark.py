@@ -4,6 +4,7 @@ from typing import Callable
 
 from protoactor.actor.actor_context import AbstractContext, GlobalRootContext
 from protoactor.actor.props import Props
+from protoactor.mailbox.dispatcher import Dispatchers
 from protoactor.mailbox.mailbox import AbstractMailbox, DefaultMailbox
 from protoactor.mailbox.queue import UnboundedMailboxQueue
 
@@ -15,7 +16,8 @@ async def process_message(ctx: AbstractContext):
 
 async def run_test(mailbox: Callable[..., AbstractMailbox]):
     props = Props.from_func(process_message) \
-                 .with_mailbox(mailbox)
+                 .with_mailbox(mailbox) \
+                 .with_dispatcher(Dispatchers().current_loop_dispatcher)
 
     pid = GlobalRootContext.spawn(props)
     for i in range(10000):
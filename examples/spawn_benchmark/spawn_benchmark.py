@@ -7,6 +7,7 @@ from protoactor.actor import PID
 from protoactor.actor.actor import Actor
 from protoactor.actor.actor_context import RootContext, AbstractContext, GlobalRootContext
 from protoactor.actor.props import Props
+from protoactor.mailbox.dispatcher import Dispatchers
 
 
 @dataclass
@@ -45,7 +46,7 @@ class MyActor(Actor):
                 await context.send(self._reply_to, self._sum)
 
 
-props = Props.from_producer(MyActor)
+props = Props.from_producer(MyActor).with_dispatcher(Dispatchers().pooled_dispatcher)
 
 
 async def main():
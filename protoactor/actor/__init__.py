@@ -1,21 +1,39 @@
+import weakref
+
 from protoactor.actor.protos_pb2 import PID
-from protoactor.actor.process import ProcessRegistry
+from protoactor.actor.process import ProcessRegistry, ActorProcess
+
+# PIDs are protobuf messages, they can neither carry extra attributes nor be hashed. The local process of a PID is
+# therefore cached by object identity until the PID is collected or the process dies.
+__process_refs = {}
+
+
+def __ref(pid):
+    entry = __process_refs.get(id(pid))
+    if entry is not None and not entry[1].is_dead:
+        return entry[1]
+
+    process = ProcessRegistry().get(pid)
+    if isinstance(process, ActorProcess) and not process.is_dead:
+        key = id(pid)
+        __process_refs[key] = (weakref.ref(pid, lambda _: __process_refs.pop(key, None)), process)
+    return process
 
 
 async def __tell(self, message):
-    await ProcessRegistry().get(self).send_user_message(self, message)
+    await __ref(self).send_user_message(self, message)
 
 
 async def __send_user_message(self, message):
-    await ProcessRegistry().get(self).send_user_message(self, message)
+    await __ref(self).send_user_message(self, message)
 
 
 async def __send_system_message(self, message):
-    await ProcessRegistry().get(self).send_system_message(self, message)
+    await __ref(self).send_system_message(self, message)
 
 
 async def __stop(self):
-    await ProcessRegistry().get(self).stop(self)
+    await __ref(self).stop(self)
 
 
 def __to_short_string(self):
@@ -15,3 +15,21 @@ class EmptyActor(Actor):
     async def receive(self, context: AbstractContext):
         await self._receive(context)
 
+
+class SyncActor(Actor):
+    """Actor whose receive never awaits, the mailbox calls it without creating a coroutine per message.
+
+    To reply, capture context.sender and schedule context.send(sender, reply) as a task.
+    """
+
+    @abstractmethod
+    def receive(self, context: AbstractContext) -> None:
+        pass
+
+
+class EmptySyncActor(SyncActor):
+    def __init__(self, receive):
+        self._receive = receive
+
+    def receive(self, context: AbstractContext):
+        self._receive(context)
@@ -6,7 +6,7 @@ from datetime import timedelta
 from enum import Enum
 from functools import reduce
 from inspect import signature
-from typing import Callable, List, Awaitable, Any
+from typing import Callable, List, Awaitable, Any, Union, Iterable
 
 from protoactor.actor import messages, log
 from protoactor.actor.cancel_token import CancelToken
@@ -22,7 +22,7 @@ from protoactor.actor.restart_statistics import RestartStatistics
 from protoactor.actor.supervision import AbstractSupervisor, Supervision, \
     AbstractSupervisorStrategy
 from protoactor.mailbox.dispatcher import AbstractMessageInvoker
-from protoactor.utils.async_timer import AsyncTimer
+from protoactor.utils.async_timer import DeadlineTimer
 
 is_import = False
 if is_import:
@@ -215,6 +215,19 @@ class RootContext(AbstractRootContext):
         name = prefix + ProcessRegistry().next_id()
         return self.spawn_named(props, name)
 
+    def spawn_many(self, props: 'Props', count_or_names: Union[int, Iterable[str]]) -> List[PID]:
+        if isinstance(count_or_names, int):
+            registry = ProcessRegistry()
+            names = [registry.next_id() for _ in range(count_or_names)]
+        else:
+            names = list(count_or_names)
+
+        if props.guardian_strategy is not None:
+            parent = Guardians().get_guardian_pid(props.guardian_strategy)
+        else:
+            parent = None
+        return props.spawn_many(names, parent)
+
     def with_headers(self, headers):
         return self.__copy_with({'_Props__headers': headers})
 
@@ -308,7 +321,7 @@ class ActorContextExtras():
         return self._children
 
     @property
-    def receive_timeout_timer(self) -> AsyncTimer:
+    def receive_timeout_timer(self) -> DeadlineTimer:
         return self._receive_timeout_timer
 
     @property
@@ -327,17 +340,14 @@ class ActorContextExtras():
     def context(self) -> AbstractContext:
         return self._context
 
-    def init_receive_timeout_timer(self, timer: AsyncTimer) -> None:
+    def init_receive_timeout_timer(self, timer: DeadlineTimer) -> None:
         self._receive_timeout_timer = timer
 
     def reset_receive_timeout_timer(self) -> None:
-        self._receive_timeout_timer.cancel()
-        self._receive_timeout_timer = AsyncTimer(self._receive_timeout_timer.interval,
-                                                 self._receive_timeout_timer.function)
-        self._receive_timeout_timer.start()
+        self._receive_timeout_timer.reset()
 
     def stop_receive_timeout_timer(self) -> None:
-        self._receive_timeout_timer.cancel()
+        self._receive_timeout_timer.pause()
 
     def kill_receive_timeout_timer(self) -> None:
         self._receive_timeout_timer.cancel()
@@ -377,6 +387,22 @@ class ActorContext(AbstractActorContext):
         self._logger = log.create_logger(logging.INFO, context=ActorContext)
         self._receive_timeout = timedelta()
 
+        # the message paths are picked once per actor, without middleware or context decorators messages go
+        # straight to the actor and to the target process
+        self._has_context_decorator = bool(props.context_decorator)
+        if props.receive_middleware_chain is not None:
+            self._process_message = self.__process_message_with_middleware
+        elif self._has_context_decorator:
+            self._process_message = self.__process_message_with_context_decorator
+        else:
+            self._process_message = self.__process_message
+        if props.sender_middleware_chain is not None:
+            self._send_user_message = self.__send_user_message_with_middleware
+        else:
+            self._send_user_message = self.__send_user_message
+        self._is_sync_actor = False
+        self._sync_receive = False
+
     @property
     def parent(self) -> PID:
         return self._parent
@@ -456,13 +482,14 @@ class ActorContext(AbstractActorContext):
 
         self._ensure_extras()
         if self._extras.receive_timeout_timer is None:
-            self._extras.init_receive_timeout_timer(AsyncTimer(self._receive_timeout,
-                                                               self.__receive_timeout_callback))
+            self._extras.init_receive_timeout_timer(DeadlineTimer(self._receive_timeout,
+                                                                  self.__receive_timeout_callback))
         else:
+            self._extras.receive_timeout_timer.interval = duration
             self.__reset_receive_timeout()
 
     def cancel_receive_timeout(self):
-        if self._extras.receive_timeout_timer is None:
+        if self._extras is None or self._extras.receive_timeout_timer is None:
             return
 
         self.__stop_receive_timeout()
@@ -471,17 +498,17 @@ class ActorContext(AbstractActorContext):
         self._receive_timeout = timedelta()
 
     async def send(self, target: PID, message: any) -> None:
-        await self.__send_user_message(target, message)
+        await self._send_user_message(target, message)
 
     async def forward(self, target: PID) -> None:
         if isinstance(self._message_or_envelope, SystemMessage):
             self._logger.warning(f'SystemMessage cannot be forwarded. {self._message_or_envelope}')
             return
-        await self.__send_user_message(target, self._message_or_envelope)
+        await self._send_user_message(target, self._message_or_envelope)
 
     async def request(self, target: PID, message: any) -> None:
         message_envelope = MessageEnvelope(message, self.my_self, None)
-        await self.__send_user_message(target, message_envelope)
+        await self._send_user_message(target, message_envelope)
 
     def reenter_after(self, target: Callable[[], Awaitable[Any]], action: Callable[[Any], None]) -> None:
         async def run(msg):
@@ -515,24 +542,24 @@ class ActorContext(AbstractActorContext):
         if timeout is None and cancellation_token is None:
             future = FutureProcess()
             message_envelope = MessageEnvelope(message, future.pid, None)
-            await self.__send_user_message(target, message_envelope)
+            await self._send_user_message(target, message_envelope)
             return await future.task
         elif timeout is not None and cancellation_token is None:
             future = FutureProcess()
             message_envelope = MessageEnvelope(message, future.pid, None)
-            await self.__send_user_message(target, message_envelope)
+            await self._send_user_message(target, message_envelope)
             return await CancelToken('token', asyncio.get_event_loop()).cancellable_wait(future.task,
                                                                                          timeout=timeout.total_seconds()
                                                                                          )
         elif timeout is None and cancellation_token is not None:
             future = FutureProcess(cancellation_token)
             message_envelope = MessageEnvelope(message, future.pid, None)
-            await self.__send_user_message(target, message_envelope)
+            await self._send_user_message(target, message_envelope)
             return await future.task
         else:
             future = FutureProcess(cancellation_token)
             message_envelope = MessageEnvelope(message, future.pid, None)
-            await self.__send_user_message(target, message_envelope)
+            await self._send_user_message(target, message_envelope)
             return await cancellation_token.cancellable_wait(future.task, timeout=timeout.total_seconds())
 
     async def escalate_failure(self, reason: Exception, message: Any):
@@ -598,11 +625,22 @@ class ActorContext(AbstractActorContext):
             if influence_timeout is True:
                 self.__stop_receive_timeout()
 
-        await self.__process_message(message)
+        await self._process_message(message)
 
         if self.receive_timeout > timedelta() and influence_timeout:
             self.__reset_receive_timeout()
 
+    def invoke_user_message_sync(self, message: any) -> bool:
+        # actors with a plain receive function are called without creating coroutines, unless the message needs
+        # the full path: middleware, decorators, receive timeouts, poison pills or a stopped actor
+        if not self._sync_receive or self._state == ContextState.Stopped or self._receive_timeout > timedelta() \
+                or isinstance(MessageEnvelope.unwrap_message(message), PoisonPill):
+            return False
+
+        self._message_or_envelope = message
+        self._actor.receive(self)
+        return True
+
     async def receive(self, envelope: MessageEnvelope):
         self._message_or_envelope = envelope
         return await self.__default_receive()
@@ -631,32 +669,41 @@ class ActorContext(AbstractActorContext):
             await self.my_self.stop()
             return
 
-        if self._props.context_decorator_chain is not None:
-            return await self.actor.receive(self._ensure_extras().context)
+        if self._has_context_decorator:
+            context = self._ensure_extras().context
+        else:
+            context = self
 
-        return await self.actor.receive(self)
+        if self._is_sync_actor:
+            return self.actor.receive(context)
+        return await self.actor.receive(context)
 
-    async def __process_message(self, message: object) -> asyncio.futures:
-        if self._props.receive_middleware_chain is not None:
-            return await self._props.receive_middleware_chain(self._ensure_extras().context,
-                                                              MessageEnvelope.wrap(message))
-        if self._props.context_decorator_chain is not None:
-            return await self._ensure_extras().context.receive(MessageEnvelope.wrap(message))
+    async def __process_message_with_middleware(self, message: object) -> asyncio.futures:
+        return await self._props.receive_middleware_chain(self._ensure_extras().context,
+                                                          MessageEnvelope.wrap(message))
 
+    async def __process_message_with_context_decorator(self, message: object) -> asyncio.futures:
+        return await self._ensure_extras().context.receive(MessageEnvelope.wrap(message))
+
+    async def __process_message(self, message: object) -> asyncio.futures:
         self._message_or_envelope = message
         return await self.__default_receive()
 
+    async def __send_user_message_with_middleware(self, target, message):
+        await self._props.sender_middleware_chain(self._ensure_extras().context,
+                                                  target,
+                                                  MessageEnvelope.wrap(message))
+
     async def __send_user_message(self, target, message):
-        if self._props.sender_middleware_chain is not None:
-            await self._props.sender_middleware_chain(self._ensure_extras().context,
-                                                      target,
-                                                      MessageEnvelope.wrap(message))
-        else:
-            await target.send_user_message(message)
+        await target.send_user_message(message)
 
     def __incarnate_actor(self):
         self._state = ContextState.Alive
         self._actor = self._props.producer()
+        # actor imports this module, so SyncActor is imported here
+        from protoactor.actor.actor import SyncActor
+        self._is_sync_actor = isinstance(self._actor, SyncActor)
+        self._sync_receive = self._is_sync_actor and self._process_message == self.__process_message
 
     async def __handle_restart(self):
         self._state = ContextState.Restarting
@@ -742,7 +789,7 @@ class ActorContext(AbstractActorContext):
 
         await self.invoke_user_message(Started())
 
-        if self._extras.stash is not None:
+        if self._extras is not None and self._extras.stash is not None:
             while len(self._extras.stash) > 0:
                 msg = self._extras.stash.pop()
                 await self.invoke_user_message(msg)
@@ -8,6 +8,8 @@ if is_import:
 
 
 class MessageEnvelope:
+    __slots__ = ('_message', '_sender', '_header')
+
     def __init__(self, message: object, sender: 'PID' = None, header: MessageHeader = None) -> None:
         self._message = message
         self._sender = sender
@@ -31,53 +33,66 @@ class MessageEnvelope:
             return message
         return MessageEnvelope(message)
 
+    # the with_* methods return the envelope itself when nothing changes, so middleware passing envelopes on
+    # unchanged does not allocate
+
     def with_sender(self, sender: 'PID'):
-        return MessageEnvelope(self.message, sender, self.header)
+        if sender is self._sender:
+            return self
+        return MessageEnvelope(self._message, sender, self._header)
 
     def with_message(self, message: Any):
-        return MessageEnvelope(message, self.sender, self.header)
+        if message is self._message:
+            return self
+        return MessageEnvelope(message, self._sender, self._header)
 
     def with_header(self, header: MessageHeader = None, key: str = None, value: str = None):
         if header is not None and key is None and value is None:
-            return MessageEnvelope(self.message, self.sender, header)
+            if header is self._header:
+                return self
+            return MessageEnvelope(self._message, self._sender, header)
         elif header is None and key is not None and value is not None:
-            message_header = self.header
+            message_header = self._header
             if message_header is None:
-                message_header = MessageHeader()
+                message_header = MessageHeader.empty()
             header = message_header.extend(key=key, value=value)
-            return MessageEnvelope(self.message, self.sender, header)
+            if header is self._header:
+                return self
+            return MessageEnvelope(self._message, self._sender, header)
         else:
             raise ValueError('Incorrect input value')
 
     def with_headers(self, items=None):
-        message_header = self.header
+        message_header = self._header
         if message_header is None:
-            message_header = MessageHeader()
+            message_header = MessageHeader.empty()
         header = message_header.extend(items=items)
-        return MessageEnvelope(self.message, self.sender, header)
+        if header is message_header:
+            return self
+        return MessageEnvelope(self._message, self._sender, header)
 
     @staticmethod
     def unwrap(message: Any) -> Any:
         if isinstance(message, MessageEnvelope):
-            return message.message, message.sender, message.header
+            return message._message, message._sender, message._header
         return message, None, None
 
     @staticmethod
     def unwrap_header(message: Any) -> MessageHeader:
-        if isinstance(message, MessageEnvelope) and message.header is not None:
-            return message.header
+        if isinstance(message, MessageEnvelope) and message._header is not None:
+            return message._header
         return MessageHeader.empty()
 
     @staticmethod
     def unwrap_message(message: Any) -> Any:
         if isinstance(message, MessageEnvelope):
-            return message.message
+            return message._message
         else:
             return message
 
     @staticmethod
     def unwrap_sender(message: Any) -> 'PID':
         if isinstance(message, MessageEnvelope):
-            return message.sender
+            return message._sender
         else:
             return None
@@ -1,12 +1,21 @@
-import collections
+from collections.abc import Mapping
 
 
-class MessageHeader(collections.Mapping):
+class MessageHeader(Mapping):
+    """Immutable message headers.
+
+    extend returns a new header and leaves this one untouched, so envelopes can share headers freely.
+    """
+
+    __slots__ = ('_data',)
 
     def __init__(self, data=None):
         if data is None:
-            data = {}
-        self._data = data
+            self._data = {}
+        elif isinstance(data, MessageHeader):
+            self._data = data._data
+        else:
+            self._data = dict(data)
 
     def __getitem__(self, key):
         return self._data[key]
@@ -17,13 +26,30 @@ class MessageHeader(collections.Mapping):
     def __iter__(self):
         return iter(self._data)
 
+    def __repr__(self):
+        return f'MessageHeader({self._data!r})'
+
     def extend(self, key=None, value=None, items=None):
         if key is not None and value is not None:
-            self._data[key] = value
-        elif items is not None:
-            self._data.update(items)
-        return MessageHeader(self._data)
+            if self._data.get(key) == value:
+                return self
+            data = dict(self._data)
+            data[key] = value
+        elif items:
+            data = {**self._data, **items}
+        else:
+            return self
+        return MessageHeader.__from_dict(data)
 
     @staticmethod
     def empty():
-        return MessageHeader()
\ No newline at end of file
+        return _EMPTY
+
+    @staticmethod
+    def __from_dict(data):
+        header = MessageHeader.__new__(MessageHeader)
+        header._data = data
+        return header
+
+
+_EMPTY = MessageHeader()
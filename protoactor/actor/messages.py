@@ -1,4 +1,4 @@
-from abc import ABCMeta
+from abc import ABCMeta, abstractmethod
 from typing import Optional, Any
 
 from protoactor.actor.protos_pb2 import PID
@@ -15,6 +15,12 @@ class AbstractNotInfluenceReceiveTimeout(metaclass=ABCMeta):
 class AutoReceiveMessage(metaclass=ABCMeta):
     pass
 
+class AbstractPriorityMessage(metaclass=ABCMeta):
+    @property
+    @abstractmethod
+    def priority(self) -> int:
+        raise NotImplementedError("Should Implement this method")
+
 
 class Restarting(metaclass=Singleton):
     pass
@@ -1,6 +1,7 @@
 import asyncio
+import itertools
+import threading
 from abc import abstractmethod
-from multiprocessing import RLock
 from typing import Callable, List
 
 from protoactor.actor.cancel_token import CancelToken
@@ -48,7 +49,8 @@ class ActorProcess(AbstractProcess):
     is_dead = property(getis_dead, setis_dead)
 
     async def send_user_message(self, pid: 'PID', message: object, sender: 'PID' = None):
-        self._mailbox.post_user_message(message)
+        if not await self._mailbox.post_user_message_async(message):
+            await DeadLettersProcess().send_user_message(pid, message, sender)
 
     async def send_system_message(self, pid: 'PID', message: object):
         self._mailbox.post_system_message(message)
@@ -65,6 +67,7 @@ class FutureProcess(AbstractProcess):
         if not absent:
             raise ProcessNameExistException(name, self._pid)
         self._loop = asyncio.get_event_loop()
+        self._loop_thread_id = threading.get_ident()
         self._future = self._loop.create_future()
         self._cancellation_token = cancellation_token
 
@@ -96,6 +99,10 @@ class FutureProcess(AbstractProcess):
         self._future.set_result(msg)
 
     async def __set_result(self, message, loop):
+        if threading.get_ident() == self._loop_thread_id:
+            if not self._future.done():
+                self._future.set_result(message)
+            return None
         concurrent = asyncio.run_coroutine_threadsafe(self.__upgrade_state(message), loop=loop)
         return asyncio.wrap_future(concurrent)
 
@@ -143,13 +150,15 @@ class GuardianProcess(AbstractProcess, AbstractSupervisor):
 
 
 class ProcessRegistry(metaclass=Singleton):
-    def __init__(self) -> None:
+    def __init__(self, shard_count: int = 16) -> None:
         self._hostResolvers = []
-        # python dict structure is atomic for primitive actions. Need to be checked
-        self._local_actor_refs = {}
-        self._sequence_id = 0
+        # local processes are spread over several dicts by id. Only single dict operations are used on them, which
+        # are atomic, so no lock is needed
+        self._local_actor_refs = [{} for _ in range(shard_count)]
+        # host resolvers resolve every PID of an address to the same process, so it is resolved once per address
+        self._remote_refs = {}
+        self._sequence_id = itertools.count(1)
         self._address = "nonhost"
-        self._lock = RLock()
 
     @property
     def address(self) -> str:
@@ -158,19 +167,35 @@ class ProcessRegistry(metaclass=Singleton):
     @address.setter
     def address(self, address: str):
         self._address = address
+        self._remote_refs.clear()
 
-    def register_host_resolver(self, resolver: Callable[['PID'], AbstractProcess]) -> None:
-        self._hostResolvers.append(resolver)
+    def register_host_resolver(self, resolver: Callable[['PID'], AbstractProcess], first: bool = False) -> None:
+        # resolvers are asked in order, first puts resolver ahead of catch-all ones like the remote one
+        if first:
+            self._hostResolvers.insert(0, resolver)
+        else:
+            self._hostResolvers.append(resolver)
+        self._remote_refs.clear()
+
+    def unregister_host_resolver(self, resolver: Callable[['PID'], AbstractProcess]) -> None:
+        self._hostResolvers.remove(resolver)
+        self._remote_refs.clear()
 
     def get(self, pid: 'PID') -> AbstractProcess:
-        if pid.address != "nonhost" and pid.address != self._address:
+        address = pid.address
+        if address != self._address and address != "nonhost":
+            reff = self._remote_refs.get(address)
+            if reff is not None:
+                return reff
+
             for resolver in self._hostResolvers:
                 reff = resolver(pid)
                 if reff is None:
                     continue
+                self._remote_refs[address] = reff
                 return reff
 
-        ref = self._local_actor_refs.get(pid.id, None)
+        ref = self.__shard(pid.id).get(pid.id)
         if ref is not None:
             return ref
 
@@ -178,22 +203,34 @@ class ProcessRegistry(metaclass=Singleton):
 
     def try_add(self, id: str, ref: AbstractProcess) -> 'PID':
         pid = PID(address=self.address, id=id)
-        if id not in self._local_actor_refs:
-            self._local_actor_refs[id] = ref
-            return pid, True
+        return pid, self.__shard(id).setdefault(id, ref) is ref
+
+    def try_add_many(self, ids: List[str], refs: List[AbstractProcess]) -> List['PID']:
+        added = []
+        for id, ref in zip(ids, refs):
+            if self.__shard(id).setdefault(id, ref) is not ref:
+                for added_id in added:
+                    self.__shard(added_id).pop(added_id)
+                raise ProcessNameExistException(id, PID(address=self.address, id=id))
+            added.append(id)
 
-        return pid, False
+        address = self.address
+        return [PID(address=address, id=id) for id in ids]
 
     def remove(self, pid: 'PID') -> None:
-        del self._local_actor_refs[pid.id]
+        ref = self.__shard(pid.id).pop(pid.id)
+        if isinstance(ref, ActorProcess):
+            # PIDs cache their process until it is dead
+            ref.is_dead = True
 
 
 
     def next_id(self) -> str:
-        with self._lock:
-            self._sequence_id += 1
+        # next() on itertools.count is atomic
+        return str(next(self._sequence_id))
 
-        return str(self._sequence_id)
+    def __shard(self, id: str) -> dict:
+        return self._local_actor_refs[hash(id) % len(self._local_actor_refs)]
 
 
 class Guardians(metaclass=Singleton):
@@ -3,7 +3,7 @@ from functools import reduce
 from typing import Callable, List
 
 from protoactor.actor import ProcessRegistry
-from protoactor.actor.actor import Actor, EmptyActor
+from protoactor.actor.actor import Actor, EmptyActor, EmptySyncActor
 from protoactor.actor.actor_context import ActorContext, AbstractContext, Started, AbstractReceiverContext, \
     AbstractSenderContext
 from protoactor.actor.exceptions import ProcessNameExistException
@@ -32,6 +32,21 @@ def default_spawner(name: str, props: 'Props', parent: PID) -> PID:
     return _pid
 
 
+def default_spawner_many(names: List[str], props: 'Props', parent: PID) -> List[PID]:
+    contexts = [ActorContext(props, parent) for _ in names]
+    mailboxes = [props.mailbox_producer() for _ in names]
+    pids = ProcessRegistry().try_add_many(names, [ActorProcess(_mailbox) for _mailbox in mailboxes])
+
+    _dispatcher = props.dispatcher
+    for _ctx, _mailbox, _pid in zip(contexts, mailboxes, pids):
+        _ctx.my_self = _pid
+        _mailbox.register_handlers(_ctx, _dispatcher)
+        _mailbox.post_system_message(Started())
+        _mailbox.start()
+
+    return pids
+
+
 def default_context_decorator(context: AbstractContext) -> AbstractContext:
     return context
 
@@ -161,6 +176,11 @@ class Props:
     def spawn(self, id: str, parent: PID = None) -> PID:
         return self.__spawner(id, self, parent)
 
+    def spawn_many(self, ids: List[str], parent: PID = None) -> List[PID]:
+        if self.__spawner is default_spawner:
+            return default_spawner_many(ids, self, parent)
+        return [self.__spawner(id, self, parent) for id in ids]
+
     def __copy_with(self, new_params: dict) -> 'Props':
         params = self.__dict__
         params.update(new_params)
@@ -195,3 +215,7 @@ class Props:
     @staticmethod
     def from_func(receive) -> 'Props':
         return Props.from_producer(lambda: EmptyActor(receive))
+
+    @staticmethod
+    def from_sync_func(receive) -> 'Props':
+        return Props.from_producer(lambda: EmptySyncActor(receive))
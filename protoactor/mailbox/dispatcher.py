@@ -1,8 +1,10 @@
 import asyncio
+import itertools
+import os
 import threading
 from abc import ABCMeta, abstractmethod
 from threading import Thread
-from typing import Callable
+from typing import Callable, List
 
 from protoactor.actor.utils import Singleton
 
@@ -20,6 +22,10 @@ class AbstractMessageInvoker(metaclass=ABCMeta):
     def escalate_failure(self, reason: Exception, msg: object):
         raise NotImplementedError("Should Implement this method")
 
+    def invoke_user_message_sync(self, msg: object) -> bool:
+        # returns True when msg was handled without awaiting, otherwise the mailbox awaits invoke_user_message
+        return False
+
 
 class AbstractDispatcher(metaclass=ABCMeta):
     @property
@@ -33,6 +39,10 @@ class AbstractDispatcher(metaclass=ABCMeta):
 
 
 class Dispatchers(metaclass=Singleton):
+    def __init__(self):
+        self._pooled_dispatcher = None
+        self._lock = threading.Lock()
+
     @property
     def default_dispatcher(self) -> AbstractDispatcher:
         return ThreadDispatcher()
@@ -41,6 +51,18 @@ class Dispatchers(metaclass=Singleton):
     def synchronous_dispatcher(self) -> AbstractDispatcher:
         return SynchronousDispatcher()
 
+    @property
+    def current_loop_dispatcher(self) -> AbstractDispatcher:
+        return CurrentLoopDispatcher()
+
+    @property
+    def pooled_dispatcher(self) -> AbstractDispatcher:
+        if self._pooled_dispatcher is None:
+            with self._lock:
+                if self._pooled_dispatcher is None:
+                    self._pooled_dispatcher = PooledLoopDispatcher()
+        return self._pooled_dispatcher
+
 
 # class ThreadDispatcher(AbstractDispatcher):
 #     def __init__(self, async_loop=None):
@@ -79,6 +101,87 @@ class ThreadDispatcher(AbstractDispatcher):
         asyncio.run(runner(**kwargs))
 
 
+class CurrentLoopDispatcher(AbstractDispatcher):
+    """Runs mailboxes on the event loop of the caller, without any extra thread.
+
+    Messages sent between actors living on the same loop never cross a thread boundary.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop = None, throughput: int = 300):
+        self._loop = loop
+        self._throughput = throughput
+
+    @property
+    def throughput(self) -> int:
+        return self._throughput
+
+    def schedule(self, runner: Callable[..., asyncio.coroutine], **kwargs: ...):
+        loop = self._loop if self._loop is not None else asyncio.get_event_loop()
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if loop is running_loop or not loop.is_running():
+            loop.create_task(runner(**kwargs))
+        else:
+            asyncio.run_coroutine_threadsafe(runner(**kwargs), loop)
+
+
+class PooledLoopDispatcher(AbstractDispatcher):
+    """Multiplexes mailboxes onto a fixed pool of event loops, each running on its own daemon thread.
+
+    Every scheduled runner is pinned to one loop of the pool (round robin) for its whole life, so a
+    mailbox always processes its messages on the same thread.
+    """
+
+    def __init__(self, pool_size: int = None, throughput: int = 300):
+        if pool_size is None:
+            pool_size = os.cpu_count() or 1
+        if pool_size <= 0:
+            raise ValueError('Pool size must be greater than zero')
+        self._pool_size = pool_size
+        self._throughput = throughput
+        self._loops = []
+        self._next_loop = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def throughput(self) -> int:
+        return self._throughput
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    @property
+    def loops(self) -> List[asyncio.AbstractEventLoop]:
+        return list(self.__ensure_started())
+
+    def schedule(self, runner: Callable[..., asyncio.coroutine], **kwargs: ...):
+        loops = self.__ensure_started()
+        loop = loops[next(self._next_loop) % self._pool_size]
+        asyncio.run_coroutine_threadsafe(runner(**kwargs), loop)
+
+    def __ensure_started(self) -> List[asyncio.AbstractEventLoop]:
+        if not self._loops:
+            with self._lock:
+                if not self._loops:
+                    loops = []
+                    for i in range(self._pool_size):
+                        loop = asyncio.new_event_loop()
+                        t = Thread(target=self.__run_loop, args=(loop,), daemon=True,
+                                   name='PooledLoopDispatcher-%s' % i)
+                        t.start()
+                        loops.append(loop)
+                    self._loops = loops
+        return self._loops
+
+    @staticmethod
+    def __run_loop(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+
 class SynchronousDispatcher(AbstractDispatcher):
     def __init__(self, async_loop=None):
         self.async_loop = async_loop
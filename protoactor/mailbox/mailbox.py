@@ -1,6 +1,7 @@
 import asyncio
 import threading
 from abc import ABCMeta, abstractmethod
+from collections import deque
 from enum import Enum
 from typing import Optional
 
@@ -8,7 +9,8 @@ from protoactor.actor.messages import SuspendMailbox, ResumeMailbox
 from protoactor.mailbox import mailbox_statistics
 from protoactor.mailbox.dispatcher import AbstractDispatcher, AbstractMessageInvoker
 from protoactor.mailbox.mailbox_statistics import AbstractMailBoxStatistics
-from protoactor.mailbox.queue import AbstractQueue, UnboundedMailboxQueue
+from protoactor.mailbox.queue import AbstractQueue, UnboundedMailboxQueue, BoundedMailboxQueue, \
+    PriorityMailboxQueue
 
 
 class MailBoxStatus(Enum):
@@ -16,15 +18,27 @@ class MailBoxStatus(Enum):
     BUSY = 1
 
 
+class BoundedMailboxOverflowStrategy(Enum):
+    DROP_NEWEST = 0
+    DROP_OLDEST = 1
+    DEAD_LETTER = 2
+    WAIT = 3
+
+
 class AbstractMailbox(metaclass=ABCMeta):
     @abstractmethod
-    def post_user_message(self, msg):
+    def post_user_message(self, msg) -> bool:
+        """Posts a user message, returns False when it was rejected and belongs to dead letters."""
         raise NotImplementedError("Should Implement this method")
 
     @abstractmethod
     def post_system_message(self, msg):
         raise NotImplementedError("Should Implement this method")
 
+    async def post_user_message_async(self, msg) -> bool:
+        """Posts a user message, returns False when it was rejected and belongs to dead letters."""
+        return self.post_user_message(msg)
+
     @abstractmethod
     def register_handlers(self, invoker: AbstractMessageInvoker, dispatcher: AbstractDispatcher):
         raise NotImplementedError("Should Implement this method")
@@ -40,45 +54,55 @@ class DefaultMailbox(AbstractMailbox):
                  statistics: [AbstractMailBoxStatistics]) -> None:
         self._system_messages_queue = system_messages_queue
         self._user_messages_queue = user_messages_queue
+        # checked before every notification, so a mailbox without statistics pays a single truth test
         self._statistics = statistics
 
-        self._event = threading.Event()
         self._async_event = None
         self._loop = None
+        self._loop_thread_id = None
 
         self._invoker = None
         self._dispatcher = None
 
+        # user messages drained from the queue but not processed yet, e.g. when the mailbox got suspended
+        self._user_messages_batch = deque()
+
         self._system_message_count = 0
         self._suspended = False
 
-    def post_user_message(self, message: object):
+    def post_user_message(self, message: object) -> bool:
         self._user_messages_queue.push(message)
-        for stats in self._statistics:
-            stats.message_posted(message)
-        self.__schedule()
+        if self._statistics:
+            for stats in self._statistics:
+                stats.message_posted(message)
+        self._schedule()
+        return True
 
     def post_system_message(self, message: object):
         self._system_messages_queue.push(message)
         self._system_message_count += 1
-        for stats in self._statistics:
-            stats.message_posted(message)
-        self.__schedule()
+        if self._statistics:
+            for stats in self._statistics:
+                stats.message_posted(message)
+        self._schedule()
 
     def register_handlers(self, invoker: AbstractMessageInvoker, dispatcher: AbstractDispatcher):
         self._invoker = invoker
         self._dispatcher = dispatcher
         self._dispatcher.schedule(self.__run)
-        self._event.wait()
 
     def start(self):
-        for stats in self._statistics:
-            stats.mailbox_stated()
+        if self._statistics:
+            for stats in self._statistics:
+                stats.mailbox_stated()
 
     def initialize(self):
-        self._loop = asyncio.get_event_loop()
+        # messages posted before the loop is known stay queued, they are picked up here
         self._async_event = asyncio.Event()
-        self._event.set()
+        self._loop_thread_id = threading.get_ident()
+        self._loop = asyncio.get_event_loop()
+        if self._system_messages_queue.has_messages() or self.__has_user_messages():
+            self._async_event.set()
 
     async def __run(self):
         self.initialize()
@@ -89,44 +113,115 @@ class DefaultMailbox(AbstractMailbox):
             self._async_event.clear()
 
             if self._system_messages_queue.has_messages() or \
-                    (not self._suspended and self._user_messages_queue.has_messages()):
-                self.__schedule()
+                    (not self._suspended and self.__has_user_messages()):
+                self._schedule()
+                # let the other mailboxes sharing this loop run before the next batch
+                await asyncio.sleep(0)
             else:
-                for stats in self._statistics:
-                    stats.mailbox_empty()
+                if self._statistics:
+                    for stats in self._statistics:
+                        stats.mailbox_empty()
 
     async def __process_messages(self):
         message = None
+        batch = self._user_messages_batch
+        invoke_user_message_sync = self._invoker.invoke_user_message_sync
         try:
             for i in range(self._dispatcher.throughput):
-                message = self._system_messages_queue.pop()
-                if message is not None:
+                if self._system_messages_queue.has_messages():
+                    message = self._system_messages_queue.pop()
                     if isinstance(message, SuspendMailbox):
                         self._suspended = True
                     elif isinstance(message, ResumeMailbox):
                         self._suspended = False
                     else:
                         await self._invoker.invoke_system_message(message)
+                    if self._statistics:
                         for stats in self._statistics:
                             stats.message_received(message)
-                    if self._suspended:
+                if self._suspended:
+                    break
+
+                if not batch:
+                    batch.extend(self._user_messages_queue.pop_many(self._dispatcher.throughput - i))
+                    if not batch:
                         break
 
-                message = self._user_messages_queue.pop()
-                if message is not None:
+                message = batch.popleft()
+                if not invoke_user_message_sync(message):
                     await self._invoker.invoke_user_message(message)
+                if self._statistics:
                     for stats in self._statistics:
                         stats.message_received(message)
-                else:
-                    break
         except Exception as e:
             await self._invoker.escalate_failure(e, message)
 
+    def __has_user_messages(self) -> bool:
+        return len(self._user_messages_batch) > 0 or self._user_messages_queue.has_messages()
+
     async def notify(self) -> None:
         self._async_event.set()
 
-    def __schedule(self):
-        self._loop.call_soon_threadsafe(lambda: self._async_event.set())
+    def _schedule(self):
+        loop = self._loop
+        if loop is None or self._async_event.is_set():
+            return
+        if threading.get_ident() == self._loop_thread_id:
+            self._async_event.set()
+        else:
+            loop.call_soon_threadsafe(self._async_event.set)
+
+
+class BoundedMailbox(DefaultMailbox):
+    """Mailbox whose user messages queue never grows beyond its size.
+
+    When the queue is full the overflow strategy decides what happens: the new message is dropped
+    (DROP_NEWEST), the oldest queued message is dropped (DROP_OLDEST), the new message is rejected to
+    dead letters (DEAD_LETTER, the default) or the sender is suspended until there is room again (WAIT).
+    Only the awaitable post_user_message_async can suspend, the synchronous post rejects the message with
+    WAIT. An actor which sends to itself, or to an actor sending back to it, never gets room again while
+    it is suspended, so WAIT only suits mailboxes whose senders are not fed by their owner.
+    Up to one throughput batch of already dequeued messages is kept outside of the queue.
+    """
+
+    def __init__(self, system_messages_queue: AbstractQueue,
+                 user_messages_queue: BoundedMailboxQueue,
+                 statistics: [AbstractMailBoxStatistics],
+                 overflow_strategy: BoundedMailboxOverflowStrategy =
+                 BoundedMailboxOverflowStrategy.DEAD_LETTER) -> None:
+        super().__init__(system_messages_queue, user_messages_queue, statistics)
+        self._overflow_strategy = overflow_strategy
+
+    @property
+    def overflow_strategy(self) -> BoundedMailboxOverflowStrategy:
+        return self._overflow_strategy
+
+    def post_user_message(self, message: object) -> bool:
+        if not self._user_messages_queue.push(message):
+            if self._overflow_strategy == BoundedMailboxOverflowStrategy.DROP_OLDEST:
+                while not self._user_messages_queue.push(message):
+                    self._user_messages_queue.pop()
+            else:
+                return self._overflow_strategy == BoundedMailboxOverflowStrategy.DROP_NEWEST
+
+        if self._statistics:
+            for stats in self._statistics:
+                stats.message_posted(message)
+        self._schedule()
+        return True
+
+    async def post_user_message_async(self, message: object) -> bool:
+        if self._overflow_strategy != BoundedMailboxOverflowStrategy.WAIT:
+            return self.post_user_message(message)
+
+        while not self._user_messages_queue.push(message):
+            await self._user_messages_queue.wait_for_capacity()
+
+        if self._statistics:
+            for stats in self._statistics:
+                stats.message_posted(message)
+        self._schedule()
+        return True
 
 
 # SynchronousMailbox
@@ -226,14 +321,23 @@ class DefaultMailbox(AbstractMailbox):
 class MailboxFactory():
     @staticmethod
     def create_bounded_mailbox(size: int,
-                               *stats: Optional[mailbox_statistics.AbstractMailBoxStatistics]) -> AbstractMailbox:
-        pass
+                               *stats: Optional[mailbox_statistics.AbstractMailBoxStatistics],
+                               overflow_strategy: BoundedMailboxOverflowStrategy =
+                               BoundedMailboxOverflowStrategy.DEAD_LETTER) -> AbstractMailbox:
+        statistics = stats if stats else []
+        return BoundedMailbox(UnboundedMailboxQueue(), BoundedMailboxQueue(size), statistics, overflow_strategy)
 
     @staticmethod
     def create_unbounded_mailbox(*stats: Optional[mailbox_statistics.AbstractMailBoxStatistics]) -> AbstractMailbox:
         statistics = stats if stats else []
         return DefaultMailbox(UnboundedMailboxQueue(), UnboundedMailboxQueue(), statistics)
 
+    @staticmethod
+    def create_unbounded_priority_mailbox(*stats: Optional[mailbox_statistics.AbstractMailBoxStatistics],
+                                          priority_levels: int = 8) -> AbstractMailbox:
+        statistics = stats if stats else []
+        return DefaultMailbox(UnboundedMailboxQueue(), PriorityMailboxQueue(priority_levels), statistics)
+
     # @staticmethod
     # def create_unbounded_synchronous_mailbox(*stats: Optional[mailbox_statistics.AbstractMailBoxStatistics]) -> \
     #         AbstractMailbox:
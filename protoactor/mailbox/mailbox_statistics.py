@@ -1,4 +1,8 @@
+import time
 from abc import ABCMeta, abstractmethod
+from array import array
+from datetime import timedelta
+from typing import List
 
 
 class AbstractMailBoxStatistics(metaclass=ABCMeta):
@@ -20,14 +24,92 @@ class AbstractMailBoxStatistics(metaclass=ABCMeta):
 
 
 class MailBoxStatistics(AbstractMailBoxStatistics):
+    """Counters and an enqueue to dequeue latency histogram for one mailbox.
+
+    Post timestamps are kept in a preallocated ring, the n-th received message is matched with the
+    n-th posted one, so latencies are exact for FIFO delivery and an approximation otherwise (system
+    messages and priority queues overtake). Latency bucket i counts latencies below 2 ** i
+    microseconds. Counters are updated without locks and may undercount slightly when many threads
+    post concurrently.
+    """
+
+    LATENCY_BUCKETS = 32
+
+    def __init__(self, ring_size: int = 4096):
+        if ring_size <= 0:
+            raise ValueError('Ring size must be greater than zero')
+        self._ring_size = ring_size
+        self._post_timestamps = array('d', [0.0]) * ring_size
+        self._latency_histogram = array('Q', [0]) * self.LATENCY_BUCKETS
+        self._posted_count = 0
+        self._received_count = 0
+        self._empty_count = 0
+        self._max_queue_depth = 0
+        self._started_at = time.perf_counter()
+
+    @property
+    def posted_count(self) -> int:
+        return self._posted_count
+
+    @property
+    def received_count(self) -> int:
+        return self._received_count
+
+    @property
+    def empty_count(self) -> int:
+        return self._empty_count
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self._posted_count - self._received_count, 0)
+
+    @property
+    def max_queue_depth(self) -> int:
+        return self._max_queue_depth
+
+    @property
+    def messages_per_second(self) -> float:
+        elapsed = time.perf_counter() - self._started_at
+        return self._received_count / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def latency_histogram(self) -> List[int]:
+        return self._latency_histogram.tolist()
+
+    def latency_percentile(self, percentile: float) -> timedelta:
+        """Returns the upper bound of the histogram bucket holding the given percentile (0..1)."""
+        total = sum(self._latency_histogram)
+        if total == 0:
+            return timedelta()
+        rank = percentile * total
+        seen = 0
+        for bucket, count in enumerate(self._latency_histogram):
+            seen += count
+            if seen >= rank:
+                return timedelta(microseconds=2 ** bucket)
+        return timedelta(microseconds=2 ** (self.LATENCY_BUCKETS - 1))
+
     def mailbox_stated(self):
-        raise NotImplementedError("Should Implement this method")
+        self._started_at = time.perf_counter()
 
     def message_posted(self, message):
-        raise NotImplementedError("Should Implement this method")
+        posted = self._posted_count
+        self._post_timestamps[posted % self._ring_size] = time.perf_counter()
+        self._posted_count = posted + 1
+        depth = posted + 1 - self._received_count
+        if depth > self._max_queue_depth:
+            self._max_queue_depth = depth
 
     def message_received(self, message):
-        raise NotImplementedError("Should Implement this method")
+        received = self._received_count
+        self._received_count = received + 1
+        if self._posted_count - received > self._ring_size:
+            return
+        latency = time.perf_counter() - self._post_timestamps[received % self._ring_size]
+        bucket = int(latency * 1000000).bit_length()
+        if bucket >= self.LATENCY_BUCKETS:
+            bucket = self.LATENCY_BUCKETS - 1
+        self._latency_histogram[bucket] += 1
 
     def mailbox_empty(self):
-        raise NotImplementedError("Should Implement this method")
\ No newline at end of file
+        self._empty_count += 1
@@ -1,6 +1,13 @@
+import asyncio
+import threading
 from abc import abstractmethod, ABCMeta
-import queue
-from typing import Optional
+from collections import deque
+from typing import Optional, List
+
+from protoactor.actor.message_envelope import MessageEnvelope
+from protoactor.actor.messages import AbstractPriorityMessage
+
+PRIORITY_HEADER_KEY = 'priority'
 
 
 class AbstractQueue(metaclass=ABCMeta):
@@ -16,19 +23,159 @@ class AbstractQueue(metaclass=ABCMeta):
     def pop(self) -> Optional[object]:
         raise NotImplementedError("Should Implement this method.")
 
+    def pop_many(self, count: int) -> List[object]:
+        messages = []
+        for _ in range(count):
+            message = self.pop()
+            if message is None:
+                break
+            messages.append(message)
+        return messages
+
 
 class UnboundedMailboxQueue(AbstractQueue):
+    """Multi-producer, single-consumer queue.
+
+    deque.append and deque.popleft are atomic, so no lock is taken on push or pop.
+    """
+
     def __init__(self):
-        self._messages = queue.Queue()
+        self._messages = deque()
+
+    def pop(self) -> Optional[object]:
+        if self._messages:
+            return self._messages.popleft()
+        return None
+
+    def pop_many(self, count: int) -> List[object]:
+        messages = self._messages
+        popleft = messages.popleft
+        return [popleft() for _ in range(min(count, len(messages)))]
+
+    def push(self, message: object):
+        self._messages.append(message)
+
+    def has_messages(self) -> bool:
+        return len(self._messages) > 0
+
+
+class BoundedMailboxQueue(AbstractQueue):
+    """Queue holding at most size messages.
+
+    push returns False instead of adding a message to a full queue, wait_for_capacity suspends the
+    caller until messages have been popped.
+    """
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError('Size must be greater than zero')
+        self._size = size
+        self._messages = deque()
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def is_full(self) -> bool:
+        return len(self._messages) >= self._size
 
     def pop(self) -> Optional[object]:
-        try:
-            return self._messages.get_nowait()
-        except queue.Empty:
-            return None
+        with self._lock:
+            if not self._messages:
+                return None
+            message = self._messages.popleft()
+            self.__wake_waiters()
+        return message
+
+    def pop_many(self, count: int) -> List[object]:
+        with self._lock:
+            messages = self._messages
+            popleft = messages.popleft
+            popped = [popleft() for _ in range(min(count, len(messages)))]
+            if popped:
+                self.__wake_waiters()
+        return popped
+
+    def push(self, message: object) -> bool:
+        with self._lock:
+            if len(self._messages) >= self._size:
+                return False
+            self._messages.append(message)
+            return True
+
+    def has_messages(self) -> bool:
+        return len(self._messages) > 0
+
+    async def wait_for_capacity(self) -> None:
+        waiter = asyncio.get_event_loop().create_future()
+        with self._lock:
+            if len(self._messages) < self._size:
+                return
+            self._waiters.append(waiter)
+        await waiter
+
+    def __wake_waiters(self) -> None:
+        # every waiter retries its push, so a cancelled waiter cannot swallow the wakeup of another one
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.get_loop().call_soon_threadsafe(self.__wake, waiter)
+
+    @staticmethod
+    def __wake(waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            waiter.set_result(None)
+
+
+class PriorityMailboxQueue(AbstractQueue):
+    """Multi-producer, single-consumer queue with one FIFO bucket per priority level.
+
+    Messages with a higher priority are popped first. The priority is read from an
+    AbstractPriorityMessage or from the 'priority' key of the envelope header, other messages and
+    headers which are not a number get the default priority. Priorities are clamped to
+    [0, priority_levels).
+    """
+
+    def __init__(self, priority_levels: int = 8, default_priority: int = None):
+        if priority_levels <= 0:
+            raise ValueError('Priority levels must be greater than zero')
+        self._priority_levels = priority_levels
+        self._default_priority = self.__clamp(default_priority if default_priority is not None
+                                              else priority_levels // 2)
+        # highest priority first
+        self._buckets = [deque() for _ in range(priority_levels)]
+
+    def pop(self) -> Optional[object]:
+        for bucket in self._buckets:
+            if bucket:
+                return bucket.popleft()
+        return None
+
+    def pop_many(self, count: int) -> List[object]:
+        # one message at a time, so a message pushed with a higher priority while the mailbox works through a
+        # batch is not invoked after the lower priority messages taken out with it
+        message = self.pop()
+        return [message] if message is not None else []
 
     def push(self, message: object):
-        self._messages.put_nowait(message)
+        priority = self.get_priority(message)
+        self._buckets[self._priority_levels - 1 - priority].append(message)
 
     def has_messages(self) -> bool:
-        return not self._messages.empty()
+        return any(self._buckets)
+
+    def get_priority(self, message: object) -> int:
+        if isinstance(message, MessageEnvelope):
+            if message.header is not None and PRIORITY_HEADER_KEY in message.header:
+                try:
+                    return self.__clamp(int(message.header[PRIORITY_HEADER_KEY]))
+                except (ValueError, TypeError):
+                    return self._default_priority
+            message = message.message
+        if isinstance(message, AbstractPriorityMessage):
+            return self.__clamp(message.priority)
+        return self._default_priority
+
+    def __clamp(self, priority: int) -> int:
+        return max(0, min(priority, self._priority_levels - 1))
@@ -0,0 +1,69 @@
+import zlib
+from abc import ABCMeta, abstractmethod
+from typing import List, Optional
+
+from protoactor.remote.protos_remote_pb2 import MessageBatch
+
+
+class AbstractCompressionCodec(metaclass=ABCMeta):
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        raise NotImplementedError('Should implement this method')
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError('Should implement this method')
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        raise NotImplementedError('Should implement this method')
+
+
+class ZlibCompressionCodec(AbstractCompressionCodec):
+    def __init__(self, level: int = 1):
+        self._level = level
+
+    @property
+    def name(self) -> str:
+        return 'zlib'
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class BatchCompression:
+    def __init__(self, codecs: List[AbstractCompressionCodec], threshold: int):
+        self._codecs = {codec.name: codec for codec in codecs}
+        self._threshold = threshold
+
+    @property
+    def codec_names(self) -> List[str]:
+        return list(self._codecs)
+
+    def negotiate(self, offered_codec_names: List[str]) -> Optional[str]:
+        # the first codec offered by the writer that this node supports wins
+        return next((name for name in offered_codec_names if name in self._codecs), None)
+
+    def compress(self, batch: MessageBatch, codec_name: str) -> MessageBatch:
+        # small batches, the common case, are not serialized just to be measured
+        if batch.ByteSize() < self._threshold:
+            return batch
+
+        data = batch.SerializeToString()
+        compressed = self._codecs[codec_name].compress(data)
+        if len(compressed) >= len(data):
+            return batch
+        return MessageBatch(compression_codec=codec_name, compressed_batch=compressed)
+
+    def decompress(self, batch: MessageBatch) -> MessageBatch:
+        if not batch.compression_codec:
+            return batch
+
+        codec = self._codecs.get(batch.compression_codec)
+        if codec is None:
+            raise ValueError(f'Unsupported compression codec {batch.compression_codec}')
+        return MessageBatch.FromString(codec.decompress(batch.compressed_batch))
@@ -1,10 +1,20 @@
+from typing import List
+
 from protoactor.actor import PID
 
 
 class Endpoint:
-    def __init__(self, watcher: PID, writer: PID):
+    def __init__(self, watcher: PID, writers: List[PID]):
         self.watcher = watcher
-        self.writer = writer
+        self.writers = writers
+
+    @property
+    def writer(self) -> PID:
+        return self.writers[0]
+
+    def writer_for(self, target: PID) -> PID:
+        # messages to the same target always use the same writer, which keeps them in order
+        return self.writers[hash(target.id) % len(self.writers)]
 
 class EndpointConnectedEvent:
     def __init__(self, address):
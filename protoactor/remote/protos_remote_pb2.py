@@ -21,7 +21,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='remote',
   syntax='proto3',
   serialized_options=_b('\252\002\014Proto.remote'),
-  serialized_pb=_b('\n%protoactor/remote/protos_remote.proto\x12\x06remote\x1a\x1dprotoactor/actor/protos.proto\"d\n\x0cMessageBatch\x12\x12\n\ntype_names\x18\x01 \x03(\t\x12\x14\n\x0ctarget_names\x18\x02 \x03(\t\x12*\n\tenvelopes\x18\x03 \x03(\x0b\x32\x17.remote.MessageEnvelope\"\xaa\x01\n\x0fMessageEnvelope\x12\x0f\n\x07type_id\x18\x01 \x01(\x05\x12\x14\n\x0cmessage_data\x18\x02 \x01(\x0c\x12\x0e\n\x06target\x18\x03 \x01(\x05\x12\x1a\n\x06sender\x18\x04 \x01(\x0b\x32\n.actor.PID\x12\x15\n\rserializer_id\x18\x05 \x01(\x05\x12-\n\x0emessage_header\x18\x06 \x01(\x0b\x32\x15.remote.MessageHeader\"~\n\rMessageHeader\x12:\n\x0bheader_data\x18\x01 \x03(\x0b\x32%.remote.MessageHeader.HeaderDataEntry\x1a\x31\n\x0fHeaderDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"-\n\x0f\x41\x63torPidRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04kind\x18\x02 \x01(\t\"@\n\x10\x41\x63torPidResponse\x12\x17\n\x03pid\x18\x01 \x01(\x0b\x32\n.actor.PID\x12\x13\n\x0bstatus_code\x18\x02 \x01(\x05\"\x06\n\x04Unit\"\x10\n\x0e\x43onnectRequest\"0\n\x0f\x43onnectResponse\x12\x1d\n\x15\x64\x65\x66\x61ult_serializer_id\x18\x01 \x01(\x05\x32}\n\x08Remoting\x12<\n\x07\x43onnect\x12\x16.remote.ConnectRequest\x1a\x17.remote.ConnectResponse\"\x00\x12\x33\n\x07Receive\x12\x14.remote.MessageBatch\x1a\x0c.remote.Unit\"\x00(\x01\x30\x01\x42\x0f\xaa\x02\x0cProto.remoteb\x06proto3')
+  serialized_pb=_b('\n%protoactor/remote/protos_remote.proto\x12\x06remote\x1a\x1dprotoactor/actor/protos.proto\"\x99\x01\n\x0cMessageBatch\x12\x12\n\ntype_names\x18\x01 \x03(\t\x12\x14\n\x0ctarget_names\x18\x02 \x03(\t\x12*\n\tenvelopes\x18\x03 \x03(\x0b\x32\x17.remote.MessageEnvelope\x12\x19\n\x11\x63ompression_codec\x18\x04 \x01(\t\x12\x18\n\x10\x63ompressed_batch\x18\x05 \x01(\x0c\"\xaa\x01\n\x0fMessageEnvelope\x12\x0f\n\x07type_id\x18\x01 \x01(\x05\x12\x14\n\x0cmessage_data\x18\x02 \x01(\x0c\x12\x0e\n\x06target\x18\x03 \x01(\x05\x12\x1a\n\x06sender\x18\x04 \x01(\x0b\x32\n.actor.PID\x12\x15\n\rserializer_id\x18\x05 \x01(\x05\x12-\n\x0emessage_header\x18\x06 \x01(\x0b\x32\x15.remote.MessageHeader\"~\n\rMessageHeader\x12:\n\x0bheader_data\x18\x01 \x03(\x0b\x32%.remote.MessageHeader.HeaderDataEntry\x1a\x31\n\x0fHeaderDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"-\n\x0f\x41\x63torPidRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04kind\x18\x02 \x01(\t\"@\n\x10\x41\x63torPidResponse\x12\x17\n\x03pid\x18\x01 \x01(\x0b\x32\n.actor.PID\x12\x13\n\x0bstatus_code\x18\x02 \x01(\x05\"\x06\n\x04Unit\",\n\x0e\x43onnectRequest\x12\x1a\n\x12\x63ompression_codecs\x18\x01 \x03(\t\"K\n\x0f\x43onnectResponse\x12\x1d\n\x15\x64\x65\x66\x61ult_serializer_id\x18\x01 \x01(\x05\x12\x19\n\x11\x63ompression_codec\x18\x02 \x01(\t2}\n\x08Remoting\x12<\n\x07\x43onnect\x12\x16.remote.ConnectRequest\x1a\x17.remote.ConnectResponse\"\x00\x12\x33\n\x07Receive\x12\x14.remote.MessageBatch\x1a\x0c.remote.Unit\"\x00(\x01\x30\x01\x42\x0f\xaa\x02\x0cProto.remoteb\x06proto3')
   ,
   dependencies=[protoactor_dot_actor_dot_protos__pb2.DESCRIPTOR,])
 
@@ -56,6 +56,20 @@ _MESSAGEBATCH = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='compression_codec', full_name='remote.MessageBatch.compression_codec', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='compressed_batch', full_name='remote.MessageBatch.compressed_batch', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -68,8 +82,8 @@ _MESSAGEBATCH = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=80,
-  serialized_end=180,
+  serialized_start=81,
+  serialized_end=234,
 )
 
 
@@ -134,8 +148,8 @@ _MESSAGEENVELOPE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=183,
-  serialized_end=353,
+  serialized_start=237,
+  serialized_end=407,
 )
 
 
@@ -172,8 +186,8 @@ _MESSAGEHEADER_HEADERDATAENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=432,
-  serialized_end=481,
+  serialized_start=486,
+  serialized_end=535,
 )
 
 _MESSAGEHEADER = _descriptor.Descriptor(
@@ -202,8 +216,8 @@ _MESSAGEHEADER = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=355,
-  serialized_end=481,
+  serialized_start=409,
+  serialized_end=535,
 )
 
 
@@ -240,8 +254,8 @@ _ACTORPIDREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=483,
-  serialized_end=528,
+  serialized_start=537,
+  serialized_end=582,
 )
 
 
@@ -278,8 +292,8 @@ _ACTORPIDRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=530,
-  serialized_end=594,
+  serialized_start=584,
+  serialized_end=648,
 )
 
 
@@ -302,8 +316,8 @@ _UNIT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=596,
-  serialized_end=602,
+  serialized_start=650,
+  serialized_end=656,
 )
 
 
@@ -314,6 +328,13 @@ _CONNECTREQUEST = _descriptor.Descriptor(
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
+    _descriptor.FieldDescriptor(
+      name='compression_codecs', full_name='remote.ConnectRequest.compression_codecs', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -326,8 +347,8 @@ _CONNECTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=604,
-  serialized_end=620,
+  serialized_start=658,
+  serialized_end=702,
 )
 
 
@@ -345,6 +366,13 @@ _CONNECTRESPONSE = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='compression_codec', full_name='remote.ConnectResponse.compression_codec', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -357,8 +385,8 @@ _CONNECTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=622,
-  serialized_end=670,
+  serialized_start=704,
+  serialized_end=779,
 )
 
 _MESSAGEBATCH.fields_by_name['envelopes'].message_type = _MESSAGEENVELOPE
@@ -451,8 +479,8 @@ _REMOTING = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   serialized_options=None,
-  serialized_start=672,
-  serialized_end=797,
+  serialized_start=781,
+  serialized_end=906,
   methods=[
   _descriptor.MethodDescriptor(
     name='Connect',
@@ -1,8 +1,14 @@
 import asyncio
+import errno
+import functools
 import logging
+import os
+import socket
+import stat
 import threading
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple, Callable, List
 
+from google.protobuf.message import Message
 from grpclib.client import Channel
 from grpclib.const import Status
 from grpclib.exceptions import GRPCError, StreamTerminatedError
@@ -25,6 +31,7 @@ from protoactor.actor.utils import Singleton
 from protoactor.mailbox.dispatcher import Dispatchers
 from protoactor.mailbox.mailbox import AbstractMailbox
 from protoactor.mailbox.queue import UnboundedMailboxQueue
+from protoactor.remote.compression import BatchCompression
 from protoactor.remote.exceptions import ActivatorException
 from protoactor.remote.messages import RemoteDeliver, RemoteWatch, RemoteUnwatch, EndpointConnectedEvent, \
     EndpointTerminatedEvent, RemoteTerminate, Endpoint
@@ -33,17 +40,66 @@ from protoactor.remote.protos_remote_pb2 import ConnectResponse, Unit, MessageHe
     ActorPidRequest, ActorPidResponse, MessageEnvelope
 from protoactor.remote.response import ResponseStatusCode
 from protoactor.remote.serialization import Serialization
+from protoactor.remote.shm_transport import SHM_SCHEME, ShmRing, ShmServer, ring_in_use
+
+UNIX_SCHEME = 'unix:'
+# PIDs of target names an EndpointReader keeps per connection, a long lived connection may address any number of
+# actors over time
+PID_CACHE_SIZE = 1024
+
+
+def parse_address(address: str) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+    """Splits a node address into host and port, or into the socket path of a unix:/path address."""
+    if address.startswith(UNIX_SCHEME):
+        return None, None, address[len(UNIX_SCHEME):]
+    host, _, port = address.rpartition(':')
+    return host, int(port), None
+
+
+def _remove_stale_socket(path: str) -> None:
+    # a socket left behind by a node which did not shut down makes binding fail, one still accepting connections
+    # belongs to a running node and is kept
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            return
+    except FileNotFoundError:
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(errno.EADDRINUSE, 'A node is already listening on %s' % path)
 
 
 class RemoteConfig():
     def __init__(self):
         self.endpoint_writer_batch_size = 1000
+        # adaptive batching: when the observed send rate predicts more messages within the window, the endpoint
+        # writer waits up to endpoint_writer_max_linger_us microseconds for them before writing a batch, or until
+        # endpoint_writer_batch_size messages or endpoint_writer_max_batch_bytes bytes are collected. 0 disables it
+        self.endpoint_writer_max_linger_us = 0
+        self.endpoint_writer_max_batch_bytes = 64 * 1024
+        # number of writers, each with its own connection, per remote address. Messages are sharded over them by
+        # target PID
+        self.endpoint_writer_lanes = 1
         self.channel_options = None
         self.call_options = None
         self.channel_credentials = None
         self.server_credentials = None
         self.advertised_hostname = None
         self.advertised_port = None
+        # codecs offered for MessageBatch compression, in order of preference. Batches are compressed only
+        # when both nodes support a common codec and the serialized batch reaches compression_threshold bytes
+        self.compression_codecs = []
+        self.compression_threshold = 1024
+        # size in bytes of the shared memory ring a node started on a shm:// address receives its batches in
+        self.shm_capacity = 4 * 1024 * 1024
+        # permissions of the socket file of a node started on a unix:/path address, left to the umask when None
+        self.unix_socket_mode = None
 
 
 class Remote(metaclass=Singleton):
@@ -54,11 +110,16 @@ class Remote(metaclass=Singleton):
         self._remote_config = None
         self._activator_pid = None
         self._endpoint_reader = None
+        self._batch_compression = None
 
     @property
     def remote_config(self) -> RemoteConfig:
         return self._remote_config
 
+    @property
+    def batch_compression(self) -> BatchCompression:
+        return self._batch_compression
+
     def get_known_kinds(self) -> list:
         return list(self._kinds.keys())
 
@@ -71,15 +132,28 @@ class Remote(metaclass=Singleton):
             raise ValueError("save must be True if recurse is True")
         return props
 
-    def start(self, hostname: str, port: int, config: RemoteConfig = RemoteConfig()) -> None:
+    def start(self, hostname: str, port: int = None, config: RemoteConfig = RemoteConfig()) -> None:
+        """Starts the node on hostname:port, on a unix domain socket when hostname is a unix:/path address or on a
+        shared memory ring when it is a shm://name address."""
+        if hostname.startswith(UNIX_SCHEME):
+            _remove_stale_socket(hostname[len(UNIX_SCHEME):])
+        elif hostname.startswith(SHM_SCHEME) and ring_in_use(hostname[len(SHM_SCHEME):]):
+            raise OSError(errno.EADDRINUSE, 'A node is already reading from %s' % hostname)
         self._remote_config = config
+        self._batch_compression = BatchCompression(config.compression_codecs, config.compression_threshold)
         ProcessRegistry().register_host_resolver(RemoteProcess)
         EndpointManager().start()
-        self._endpoint_reader = EndpointReader()
-
-        Dispatchers().default_dispatcher.schedule(self.__run, hostname=hostname, port=port)
-
-        address = f'{hostname}:{port}'
+        self._endpoint_reader = EndpointReader(self._batch_compression)
+
+        if hostname.startswith(SHM_SCHEME):
+            Dispatchers().default_dispatcher.schedule(self.__run_shm, name=hostname[len(SHM_SCHEME):])
+            address = hostname
+        elif hostname.startswith(UNIX_SCHEME):
+            Dispatchers().default_dispatcher.schedule(self.__run_unix, path=hostname[len(UNIX_SCHEME):])
+            address = hostname
+        else:
+            Dispatchers().default_dispatcher.schedule(self.__run, hostname=hostname, port=port)
+            address = f'{hostname}:{port}'
         ProcessRegistry().address = address
         self.__spawn_activator()
         self._logger.debug(f'Starting Proto.Actor server on {address}')
@@ -127,24 +201,43 @@ class Remote(metaclass=Singleton):
         await self._server.start(host=hostname, port=port)
         await self._server.wait_closed()
 
+    async def __run_unix(self, path: str):
+        self._server = Server([self._endpoint_reader], loop=asyncio.get_event_loop())
+        await self._server.start(path=path)
+        if self._remote_config.unix_socket_mode is not None:
+            os.chmod(path, self._remote_config.unix_socket_mode)
+        try:
+            await self._server.wait_closed()
+        finally:
+            if os.path.exists(path):
+                os.unlink(path)
+
+    async def __run_shm(self, name: str):
+        self._server = ShmServer(self._endpoint_reader, name, self._remote_config.shm_capacity,
+                                 Serialization().default_serializer_id)
+        await self._server.start()
+        await self._server.wait_closed()
+
 
 class RemoteProcess(AbstractProcess):
+    """Forwards messages to the node at the address of pid, ProcessRegistry shares one instance per address."""
+
     def __init__(self, pid: 'PID'):
-        self._pid = pid
+        self._address = pid.address
 
     async def send_user_message(self, pid: 'PID', message: object, sender: 'PID' = None):
-        await self.send(message)
+        await self.send(pid, message)
 
     async def send_system_message(self, pid: 'PID', message: object):
-        await self.send(message)
+        await self.send(pid, message)
 
-    async def send(self, message: any):
+    async def send(self, pid: 'PID', message: any):
         if isinstance(message, Watch):
-            await EndpointManager().remote_watch(RemoteWatch(message.watcher, self._pid))
+            await EndpointManager().remote_watch(RemoteWatch(message.watcher, pid))
         elif isinstance(message, Unwatch):
-            await EndpointManager().remote_unwatch(RemoteUnwatch(message.watcher, self._pid))
+            await EndpointManager().remote_unwatch(RemoteUnwatch(message.watcher, pid))
         else:
-            await Remote().send_message(self._pid, message, -1)
+            await Remote().send_message(pid, message, -1)
 
 
 class EndpointManager(metaclass=Singleton):
@@ -185,7 +278,7 @@ class EndpointManager(metaclass=Singleton):
 
     async def remote_deliver(self, msg: RemoteDeliver) -> None:
         endpoint = await self.__ensure_connected(msg.target.address)
-        await GlobalRootContext.send(endpoint.writer, msg)
+        await GlobalRootContext.send(endpoint.writer_for(msg.target), msg)
 
     async def remote_terminate(self, msg: RemoteTerminate):
         endpoint = await self.__ensure_connected(msg.watchee.address)
@@ -199,7 +292,8 @@ class EndpointManager(metaclass=Singleton):
         endpoint = self._connections.get(msg.address)
         if endpoint is not None:
             await GlobalRootContext.send(endpoint.watcher, msg)
-            await GlobalRootContext.send(endpoint.writer, msg)
+            for writer in endpoint.writers:
+                await GlobalRootContext.send(writer, msg)
             del self._connections[msg.address]
 
     async def __ensure_connected(self, address) -> Endpoint:
@@ -211,45 +305,67 @@ class EndpointManager(metaclass=Singleton):
 
 
 class EndpointReader(RemotingBase):
-    def __init__(self):
+    def __init__(self, batch_compression: BatchCompression):
         self._suspended = False
+        self._batch_compression = batch_compression
 
     async def Connect(self, stream):
         if self._suspended:
             raise GRPCError(Status.CANCELLED, "Suspended")
-        await stream.send_message(ConnectResponse(default_serializer_id=Serialization().default_serializer_id))
+        request = await stream.recv_message()
+        compression_codec = self._batch_compression.negotiate(request.compression_codecs)
+        await stream.send_message(ConnectResponse(default_serializer_id=Serialization().default_serializer_id,
+                                                  compression_codec=compression_codec or ''))
 
     async def Receive(self, stream) -> None:
-        targets = []
+        # writers keep this stream open and send many batches through it, each batch is acknowledged
+        # separately and carries its own target names
+        pids = self.pid_cache()
         async for batch in stream:
             if self._suspended:
+                # dropped, acknowledged only so the writer does not wait for it
                 await stream.send_message(Unit())
+                continue
 
-            for i in range(len(batch.target_names)):
-                targets.append(PID(address=ProcessRegistry().address, id=batch.target_names[i]))
-
-            type_names = list(batch.type_names)
-            for envelope in batch.envelopes:
-                target = targets[envelope.target]
-                type_name = type_names[envelope.type_id]
-                message = Serialization().deserialize(type_name, envelope.message_data, envelope.serializer_id)
-
-                if isinstance(message, Terminated):
-                    await EndpointManager().remote_terminate(RemoteTerminate(target, message.who))
-                elif isinstance(message, Watch):
-                    await target.send_system_message(message)
-                elif isinstance(message, Unwatch):
-                    await target.send_system_message(message)
-                elif isinstance(message, Stop):
-                    await target.send_system_message(message)
-                else:
-                    header = None
-                    if envelope.message_header is not None:
-                        header = proto.MessageHeader(envelope.message_header.header_data)
-                    local_envelope = proto.MessageEnvelope(message, envelope.sender, header)
-                    await GlobalRootContext.send(target, local_envelope)
+            await self.receive_batch(batch, pids)
+            await stream.send_message(Unit())
+
+    @staticmethod
+    def pid_cache() -> Callable[[str], PID]:
+        """Returns the PIDs of target names for one connection, keeping the most recently used ones."""
+        address = ProcessRegistry().address
+        return functools.lru_cache(maxsize=PID_CACHE_SIZE)(lambda target_name: PID(address=address, id=target_name))
+
+    async def receive_batch(self, batch: MessageBatch, pids: Callable[[str], PID]) -> None:
+        serialization = Serialization()
+        registry = ProcessRegistry()
+        batch = self._batch_compression.decompress(batch)
+        targets = []
+        for target_name in batch.target_names:
+            pid = pids(target_name)
+            targets.append((pid, registry.get(pid)))
+
+        type_names = batch.type_names
+        for envelope in batch.envelopes:
+            target, process = targets[envelope.target]
+            # message_data already is an immutable bytes object owned by the batch, the parsers read it
+            # through a memoryview without copying
+            message = serialization.deserialize(type_names[envelope.type_id], envelope.message_data,
+                                                envelope.serializer_id)
+
+            if isinstance(message, Terminated):
+                await EndpointManager().remote_terminate(RemoteTerminate(target, message.who))
+            elif isinstance(message, (Watch, Unwatch, Stop)):
+                await process.send_system_message(target, message)
+            else:
+                header = None
+                if envelope.HasField('message_header'):
+                    header = proto.MessageHeader(envelope.message_header.header_data)
+                await process.send_user_message(target, proto.MessageEnvelope(message, envelope.sender, header))
 
-        await stream.send_message(Unit())
+    @property
+    def suspended(self) -> bool:
+        return self._suspended
 
     def suspend(self, suspended) -> None:
         self._suspended = suspended
@@ -338,8 +454,10 @@ class EndpointWatcher(Actor):
 
 class EndpointWriter(Actor):
     def __init__(self, address: str, channel_options: Dict[str, str], call_options,
-                 channel_credentials):
+                 channel_credentials, batch_compression: BatchCompression):
         self._serializer_id = None
+        self._batch_compression = batch_compression
+        self._compression_codec = None
         self._logger = log.create_logger(logging.INFO, context=EndpointWriter)
         self._client = None
         self._channel = None
@@ -348,7 +466,9 @@ class EndpointWriter(Actor):
         self._call_options = call_options
         self._channel_credentials = channel_credentials
         self._stream = None
-        self._stream_writer = None
+        self._stream_task = None
+        # replaces the channel and stream for shm:// addresses
+        self._ring = None
 
     async def receive(self, context: AbstractContext) -> None:
         message = context.message
@@ -368,6 +488,7 @@ class EndpointWriter(Actor):
             type_name_list = []
             target_name_list = []
 
+            serialization = Serialization()
             for rd in message:
                 target_name = rd.target.id
                 if rd.serializer_id == -1:
@@ -381,7 +502,7 @@ class EndpointWriter(Actor):
                 else:
                     target_id = target_names[target_name]
 
-                type_name = Serialization().get_type_name(rd.message, serializer_id)
+                type_name, serialize = serialization.get_serializer(rd.message, serializer_id)
                 if type_name not in type_names:
                     type_id = type_names[type_name] = len(type_names)
                     type_name_list.append(type_name)
@@ -392,7 +513,7 @@ class EndpointWriter(Actor):
                 if rd.header is not None and len(rd.header) > 0:
                     header = MessageHeader(header_data=rd.header)
 
-                message_data = Serialization().serialize(rd.message, serializer_id)
+                message_data = serialize(rd.message)
 
                 envelope = MessageEnvelope(type_id=type_id,
                                            message_data=message_data,
@@ -408,41 +529,157 @@ class EndpointWriter(Actor):
             batch.type_names.extend(type_name_list)
             batch.envelopes.extend(envelopes)
 
-            await self.__send_envelopes_async(batch, type_name)
+            if self._compression_codec is not None:
+                batch = self._batch_compression.compress(batch, self._compression_codec)
+
+            await self.__send_envelopes_async(batch)
 
     async def __started_async(self):
         self._logger.debug(f'Connecting to address {self._address}')
-        host, port = self._address.split(':')
         try:
-            self._channel = Channel(host=host, port=port, loop=asyncio.get_event_loop())
-            self._client = RemotingStub(self._channel)
-            res = await self._client.Connect(ConnectRequest())
-            self._serializer_id = res.default_serializer_id
+            if self._address.startswith(SHM_SCHEME):
+                await self.__open_stream_async()
+                self._serializer_id = self._ring.serializer_id
+            else:
+                await self.__connect_async()
         except Exception:
-            self._logger.exception(f'GRPC Failed to connect to address {self._address}')
+            self._logger.exception(f'Failed to connect to address {self._address}')
             await asyncio.sleep(2)
             raise Exception()
 
         await GlobalEventStream.publish(EndpointConnectedEvent(self._address))
         self._logger.debug(f'Connected to address {self._address}')
 
+    async def __connect_async(self):
+        host, port, path = parse_address(self._address)
+        self._channel = Channel(host=host, port=port, path=path, loop=asyncio.get_event_loop())
+        self._client = RemotingStub(self._channel)
+        res = await self._client.Connect(ConnectRequest(compression_codecs=self._batch_compression.codec_names))
+        self._serializer_id = res.default_serializer_id
+        self._compression_codec = res.compression_codec or None
+        await self.__open_stream_async()
+
     async def __stopped_async(self):
-        self._channel.close()
+        await self.__close_stream_async()
+        if self._channel is not None:
+            self._channel.close()
 
     async def __restarting_async(self):
-        self._channel.close()
+        await self.__close_stream_async()
+        if self._channel is not None:
+            self._channel.close()
 
-    async def __send_envelopes_async(self, batch, context):
+    async def __send_envelopes_async(self, batch):
         try:
-            await self._client.Receive([batch])
-        except ConnectionRefusedError:
-            await GlobalEventStream.publish(EndpointTerminatedEvent(self._address))
-            self._logger.exception(f'gRPC Failed to send to address {self._address}')
+            await self.__write_batch_async(batch)
+        except (OSError, StreamTerminatedError, GRPCError):
+            # the stream broke since the last batch, reconnect once before giving up on the endpoint
+            try:
+                await self.__close_stream_async()
+                await self.__open_stream_async()
+                await self.__write_batch_async(batch)
+            except (OSError, StreamTerminatedError, GRPCError):
+                await GlobalEventStream.publish(EndpointTerminatedEvent(self._address))
+                self._logger.exception(f'gRPC Failed to send to address {self._address}')
+
+    async def __write_batch_async(self, batch):
+        if self._stream is None and self._ring is None:
+            await self.__open_stream_async()
+        if self._ring is not None:
+            for data in self.__ring_records(batch):
+                await self._ring.write_async(data)
+        else:
+            await self._stream.send_message(batch)
+
+    def __ring_records(self, batch: MessageBatch) -> List[bytes]:
+        # a batch larger than the ring is written in parts, the target and type names stay valid in each part
+        data = batch.SerializeToString()
+        if len(data) <= self._ring.max_record_size:
+            return [data]
+        if len(batch.envelopes) <= 1:
+            self._logger.warning(f'Dropped a message of {len(data)} bytes, it does not fit in the shared memory '
+                                 f'ring of {self._address}')
+            return []
+        half = len(batch.envelopes) // 2
+        records = []
+        for envelopes in (batch.envelopes[:half], batch.envelopes[half:]):
+            records.extend(self.__ring_records(MessageBatch(target_names=batch.target_names,
+                                                            type_names=batch.type_names,
+                                                            envelopes=envelopes)))
+        return records
+
+    async def __open_stream_async(self):
+        if self._address.startswith(SHM_SCHEME):
+            self._ring = ShmRing.attach(self._address[len(SHM_SCHEME):])
+            return
+        opened = asyncio.get_event_loop().create_future()
+        self._stream_task = asyncio.ensure_future(self.__run_stream_async(opened))
+        await opened
+
+    async def __run_stream_async(self, opened):
+        try:
+            async with self._client.Receive.open() as stream:
+                await stream.send_request()
+                self._stream = stream
+                opened.set_result(None)
+                # acknowledgements are drained here, so batches are written without waiting for the previous ones
+                while await stream.recv_message() is not None:
+                    pass
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            if not opened.done():
+                opened.set_exception(e)
+            else:
+                self._logger.debug(f'Stream to address {self._address} closed: {e!r}')
+        finally:
+            self._stream = None
+
+    async def __close_stream_async(self):
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            await asyncio.gather(self._stream_task, return_exceptions=True)
+            self._stream_task = None
+
+
+class BatchLinger:
+    """Decides how long the endpoint writer waits for more messages before writing a batch.
+
+    The send rate is estimated from the batches written so far. Lingering only happens when at least one more
+    message is expected within max_linger, and never for longer than it takes to fill the batch at that rate.
+    """
+
+    def __init__(self, max_linger: float, batch_size: int, smoothing: float = 0.2):
+        self._max_linger = max_linger
+        self._batch_size = batch_size
+        self._smoothing = smoothing
+        self._rate = 0.0
+        self._last_flush = None
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def delay(self, queued: int) -> float:
+        if self._max_linger <= 0 or queued >= self._batch_size or self._rate * self._max_linger < 1:
+            return 0
+        return min(self._max_linger, (self._batch_size - queued) / self._rate)
+
+    def flushed(self, count: int, now: float) -> None:
+        if self._last_flush is not None and now > self._last_flush:
+            rate = count / (now - self._last_flush)
+            self._rate += self._smoothing * (rate - self._rate)
+        self._last_flush = now
 
 
 class EndpointWriterMailbox(AbstractMailbox):
-    def __init__(self, batch_size):
+    def __init__(self, batch_size, max_linger_us=0, max_batch_bytes=0):
         self._batch_size = batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._linger = BatchLinger(max_linger_us / 1000000, batch_size)
         self._system_messages = UnboundedMailboxQueue()
         self._user_messages = UnboundedMailboxQueue()
         self._suspended = False
@@ -453,9 +690,10 @@ class EndpointWriterMailbox(AbstractMailbox):
         self._loop = None
         self._logger = log.create_logger(logging.INFO, context=EndpointWriterMailbox)
 
-    def post_user_message(self, msg):
+    def post_user_message(self, msg) -> bool:
         self._user_messages.push(msg)
         self.__schedule()
+        return True
 
     def post_system_message(self, msg):
         self._system_messages.push(msg)
@@ -501,18 +739,47 @@ class EndpointWriterMailbox(AbstractMailbox):
             if not self._suspended:
                 batch.clear()
 
-            while msg := self._user_messages.pop():
-                batch.append(msg)
-                if len(batch) >= self._batch_size:
-                    break
+            batch.extend(self._user_messages.pop_many(self._batch_size))
+            if len(batch) > 0:
+                await self.__linger(batch)
 
             if len(batch) > 0:
                 message = batch
+                self._linger.flushed(len(batch), self._loop.time())
                 await self._invoker.invoke_user_message(batch)
         except Exception as e:
             self._logger.exception(f'Exception in Run')
             await self._invoker.escalate_failure(e, message)
 
+    async def __linger(self, batch):
+        delay = self._linger.delay(len(batch))
+        if delay <= 0:
+            return
+
+        deadline = self._loop.time() + delay
+        batch_bytes = self.__size_of(batch)
+        while len(batch) < self._batch_size and (self._max_batch_bytes <= 0 or batch_bytes < self._max_batch_bytes):
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+
+            self._async_event.clear()
+            if not self._user_messages.has_messages():
+                try:
+                    await asyncio.wait_for(self._async_event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            messages = self._user_messages.pop_many(self._batch_size - len(batch))
+            batch.extend(messages)
+            batch_bytes += self.__size_of(messages)
+
+    def __size_of(self, messages):
+        if self._max_batch_bytes <= 0:
+            return 0
+        return sum(msg.message.ByteSize() for msg in messages
+                   if isinstance(msg, RemoteDeliver) and isinstance(msg.message, Message))
+
     def __schedule(self):
         self._loop.call_soon_threadsafe(lambda: self._async_event.set())
 
@@ -527,8 +794,9 @@ class EndpointSupervisor(Actor, AbstractSupervisorStrategy):
         if isinstance(message, str):
             address = str(message)
             watcher = self.__spawn_watcher(address, context)
-            writer = self.__spawn_writer(address, context)
-            await context.respond(Endpoint(watcher, writer))
+            writers = [self.__spawn_writer(address, context)
+                       for _ in range(max(1, Remote().remote_config.endpoint_writer_lanes))]
+            await context.respond(Endpoint(watcher, writers))
 
     def __spawn_watcher(self, address: str, context: AbstractContext) -> PID:
         watcher_props = Props.from_producer(lambda: EndpointWatcher(address))
@@ -540,11 +808,14 @@ class EndpointSupervisor(Actor, AbstractSupervisorStrategy):
             address,
             Remote().remote_config.channel_options,
             Remote().remote_config.call_options,
-            Remote().remote_config.channel_credentials))
-
-        writer_props = writer_props.with_mailbox(lambda: EndpointWriterMailbox(Remote()
-                                                                               .remote_config
-                                                                               .endpoint_writer_batch_size))
+            Remote().remote_config.channel_credentials,
+            Remote().batch_compression))
+
+        remote_config = Remote().remote_config
+        writer_props = writer_props.with_mailbox(lambda: EndpointWriterMailbox(
+            remote_config.endpoint_writer_batch_size,
+            remote_config.endpoint_writer_max_linger_us,
+            remote_config.endpoint_writer_max_batch_bytes))
         writer = context.spawn(writer_props)
         return writer
 
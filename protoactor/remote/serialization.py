@@ -1,4 +1,6 @@
+import functools
 from abc import abstractmethod, ABCMeta
+from typing import Callable, Optional, Tuple, Any
 
 from google.protobuf import json_format
 from google.protobuf.message import Message
@@ -22,6 +24,14 @@ class AbstractSerializer(metaclass=ABCMeta):
     def get_type_name(self, message):
         raise NotImplementedError('Should implement this method')
 
+    def get_serializer(self, message_type: type) -> Optional[Tuple[str, Callable[[Any], bytes]]]:
+        # type name and serialize function shared by every message of message_type, None when they depend on
+        # the message instance
+        return None
+
+    def get_deserializer(self, type_name: str, message_class: type) -> Callable[[bytes], Any]:
+        return functools.partial(self.deserialize, type_name=type_name)
+
 
 class ProtobufSerializer(AbstractSerializer):
     def serialize(self, obj):
@@ -30,16 +40,21 @@ class ProtobufSerializer(AbstractSerializer):
         return obj.SerializeToString()
 
     def deserialize(self, bytes_str, type_name):
-        message_descriptor = Serialization().type_lookup[type_name]
-        msg = message_descriptor._concrete_class()
-        msg.ParseFromString(bytes_str)
-        return msg
+        return Serialization().get_message_class(type_name).FromString(bytes_str)
 
     def get_type_name(self, obj):
         if not isinstance(obj, Message):
             raise TypeError("obj must be of type Message")
         return obj.DESCRIPTOR.full_name
 
+    def get_serializer(self, message_type):
+        if issubclass(message_type, Message):
+            return message_type.DESCRIPTOR.full_name, message_type.SerializeToString
+        return None
+
+    def get_deserializer(self, type_name, message_class):
+        return message_class.FromString
+
 
 class JsonSerializer(AbstractSerializer):
     def serialize(self, obj):
@@ -48,8 +63,7 @@ class JsonSerializer(AbstractSerializer):
         return json_format.MessageToJson(obj)
 
     def deserialize(self, bytes_str, type_name):
-        message_descriptor = Serialization().type_lookup[type_name]
-        msg = message_descriptor._concrete_class()
+        msg = Serialization().get_message_class(type_name)()
         json_format.Parse(bytes_str, msg)
         return msg
 
@@ -60,6 +74,11 @@ class JsonSerializer(AbstractSerializer):
             raise TypeError("obj must be of type Message")
         return obj.DESCRIPTOR.full_name
 
+    def get_serializer(self, message_type):
+        if issubclass(message_type, Message):
+            return message_type.DESCRIPTOR.full_name, self.serialize
+        return None
+
 
 class Serialization(metaclass=Singleton):
     def __init__(self):
@@ -67,6 +86,11 @@ class Serialization(metaclass=Singleton):
         self.__serializers = []
         self.__protobuf_serializer = ProtobufSerializer()
         self.__default_serializer_id = None
+        # dispatch caches filled when descriptors and serializers are registered, keyed by
+        # (message class, serializer id) and (type name, serializer id)
+        self.__message_classes = {}
+        self.__serializer_cache = {}
+        self.__deserializer_cache = {}
 
         self.register_file_descriptor(protos_descriptor)
         self.register_file_descriptor(protos_remote_descriptor)
@@ -83,20 +107,54 @@ class Serialization(metaclass=Singleton):
 
     def register_serializer(self, serializer, make_default=False):
         self.__serializers.append(serializer)
+        serializer_id = len(self.__serializers) - 1
         if make_default:
-            self.__default_serializer_id = len(self.__serializers) - 1
+            self.__default_serializer_id = serializer_id
+
+        for name, message_class in self.__message_classes.items():
+            self.__cache_message_type(name, message_class, serializer_id)
 
     def register_file_descriptor(self, descriptor):
         for message_name, message_type in descriptor.message_types_by_name.items():
             name = descriptor.package + '.' + message_name
             if name not in self.type_lookup:
                 self.type_lookup[name] = message_type
+                self.__message_classes[name] = message_type._concrete_class
+                for serializer_id in range(len(self.__serializers)):
+                    self.__cache_message_type(name, message_type._concrete_class, serializer_id)
+
+    def get_message_class(self, type_name):
+        return self.__message_classes[type_name]
+
+    def get_serializer(self, message, serializer_id):
+        """Returns the type name of message and the function serializing it."""
+        key = (type(message), serializer_id)
+        entry = self.__serializer_cache.get(key)
+        if entry is None:
+            entry = self.__serializers[serializer_id].get_serializer(type(message))
+            if entry is None:
+                serializer = self.__serializers[serializer_id]
+                return serializer.get_type_name(message), serializer.serialize
+            self.__serializer_cache[key] = entry
+        return entry
 
     def serialize(self, message, serializer_id):
-        return self.__serializers[serializer_id].serialize(message)
+        return self.get_serializer(message, serializer_id)[1](message)
 
     def get_type_name(self, message, serializer_id):
-        return self.__serializers[serializer_id].get_type_name(message)
+        return self.get_serializer(message, serializer_id)[0]
 
     def deserialize(self, type_name, data, serializer_id):
-        return self.__serializers[serializer_id].deserialize(data, type_name)
+        deserializer = self.__deserializer_cache.get((type_name, serializer_id))
+        if deserializer is None:
+            deserializer = self.__serializers[serializer_id].get_deserializer(type_name,
+                                                                              self.__message_classes[type_name])
+            self.__deserializer_cache[(type_name, serializer_id)] = deserializer
+        return deserializer(data)
+
+    def __cache_message_type(self, name, message_class, serializer_id):
+        serializer = self.__serializers[serializer_id]
+        entry = serializer.get_serializer(message_class)
+        if entry is not None:
+            self.__serializer_cache[(message_class, serializer_id)] = entry
+        self.__deserializer_cache[(name, serializer_id)] = serializer.get_deserializer(name, message_class)
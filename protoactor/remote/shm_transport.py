@@ -0,0 +1,272 @@
+import asyncio
+import errno
+import fcntl
+import logging
+import os
+import struct
+import tempfile
+from datetime import timedelta
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional
+
+from protoactor.actor import log
+from protoactor.remote.protos_remote_pb2 import MessageBatch
+
+SHM_SCHEME = 'shm://'
+
+# head (read position), tail (write position), capacity, default serializer id of the reader, closed flag
+_HEADER = struct.Struct('<QQQiB')
+_TAIL_OFFSET = 8
+_CLOSED_OFFSET = 28
+_HEADER_SIZE = 64
+_LENGTH = struct.Struct('<I')
+
+
+def _untrack(shm: SharedMemory) -> None:
+    # the resource tracker unlinks segments when the process which opened them exits, but a ring outlives its writers
+    # and is unlinked by its reader
+    resource_tracker.unregister(shm._name, 'shared_memory')
+
+
+def _paths(name: str):
+    base = os.path.join(tempfile.gettempdir(), 'protoactor-%s' % name)
+    return 'protoactor-%s' % name, base + '.fifo', base + '.lock'
+
+
+def ring_in_use(name: str) -> bool:
+    """Tells whether a running node reads from the ring of name, its owner keeps the wakeup pipe open for reading."""
+    _, fifo_path, _ = _paths(name)
+    try:
+        fifo = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        # opening a pipe without a reader for writing fails with ENXIO
+        if e.errno == errno.ENXIO:
+            return False
+        raise
+    os.close(fifo)
+    return True
+
+
+class ShmRing:
+    """Byte ring buffer in shared memory, read by the node that created it and written by any number of writers.
+
+    Records are length prefixed MessageBatch bytes. Writers serialize on a file lock and wake the reader through a
+    named pipe after every record, positions only ever grow and are taken modulo the capacity.
+    """
+
+    def __init__(self, name: str, shm: SharedMemory, fifo: int, lock: Optional[int]):
+        self._name = name
+        self._shm = shm
+        self._buf = shm.buf
+        self._fifo = fifo
+        # only writers take the lock, the reader has none
+        self._lock = lock
+        self._capacity = _HEADER.unpack_from(self._buf)[2]
+
+    @classmethod
+    def create(cls, name: str, capacity: int, serializer_id: int) -> 'ShmRing':
+        shm_name, fifo_path, lock_path = _paths(name)
+        if ring_in_use(name):
+            raise OSError(errno.EADDRINUSE, 'A node is already reading from shared memory endpoint %s' % name)
+        try:
+            shm = SharedMemory(shm_name, create=True, size=_HEADER_SIZE + capacity)
+        except FileExistsError:
+            # left behind by a node which did not shut down, as no node reads from it
+            stale = SharedMemory(shm_name)
+            stale.close()
+            stale.unlink()
+            shm = SharedMemory(shm_name, create=True, size=_HEADER_SIZE + capacity)
+        _untrack(shm)
+        _HEADER.pack_into(shm.buf, 0, 0, 0, capacity, serializer_id, 0)
+
+        if os.path.exists(fifo_path):
+            os.unlink(fifo_path)
+        os.mkfifo(fifo_path)
+        os.close(os.open(lock_path, os.O_CREAT | os.O_WRONLY, 0o600))
+        # opened for reading and writing, so the pipe never reports end of file while no writer is attached
+        fifo = os.open(fifo_path, os.O_RDWR | os.O_NONBLOCK)
+        return cls(name, shm, fifo, None)
+
+    @classmethod
+    def attach(cls, name: str) -> 'ShmRing':
+        shm_name, fifo_path, lock_path = _paths(name)
+        shm = SharedMemory(shm_name)
+        _untrack(shm)
+        if _HEADER.unpack_from(shm.buf)[4]:
+            shm.close()
+            raise ConnectionRefusedError('Shared memory endpoint %s is closed' % name)
+        return cls(name, shm, os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK), os.open(lock_path, os.O_RDWR))
+
+    @property
+    def max_record_size(self) -> int:
+        return self._capacity - _LENGTH.size
+
+    @property
+    def serializer_id(self) -> int:
+        return _HEADER.unpack_from(self._buf)[3]
+
+    @property
+    def closed(self) -> bool:
+        return self._buf is None or bool(_HEADER.unpack_from(self._buf)[4])
+
+    def fileno(self) -> int:
+        return self._fifo
+
+    def write(self, data: bytes) -> bool:
+        """Appends a record, returns False when the ring has no room for it yet."""
+        size = _LENGTH.size + len(data)
+        if size > self._capacity:
+            raise ValueError('Batch of %s bytes does not fit in a ring of %s bytes' % (len(data), self._capacity))
+
+        fcntl.flock(self._lock, fcntl.LOCK_EX)
+        try:
+            head, tail, capacity, _, closed = _HEADER.unpack_from(self._buf)
+            if closed:
+                raise ConnectionResetError('Shared memory endpoint is closed')
+            if tail + size - head > capacity:
+                return False
+            self.__copy_in(tail, _LENGTH.pack(len(data)))
+            self.__copy_in(tail + _LENGTH.size, data)
+            # the record is complete before the reader can see the new tail
+            struct.pack_into('<Q', self._buf, _TAIL_OFFSET, tail + size)
+        finally:
+            fcntl.flock(self._lock, fcntl.LOCK_UN)
+
+        self.__wake_reader()
+        return True
+
+    async def write_async(self, data: bytes, timeout: timedelta = timedelta(seconds=5)) -> None:
+        """Appends a record, waiting for the reader to make room for it at most for timeout."""
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout.total_seconds()
+        delay = 0.0005
+        while not self.write(data):
+            # a full ring either has a slow reader or none at all, the wakeup fails once the reader is gone
+            self.__wake_reader()
+            if loop.time() >= deadline:
+                raise TimeoutError('Shared memory endpoint %s has no room within %s' % (self._name, timeout))
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+
+    def read(self) -> List[bytes]:
+        """Takes all complete records, only the creator of the ring reads from it."""
+        try:
+            while os.read(self._fifo, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+        head, tail = struct.unpack_from('<QQ', self._buf)
+        records = []
+        while head < tail:
+            length = _LENGTH.unpack(self.__copy_out(head, _LENGTH.size))[0]
+            records.append(self.__copy_out(head + _LENGTH.size, length))
+            head += _LENGTH.size + length
+        struct.pack_into('<Q', self._buf, 0, head)
+        return records
+
+    def close(self) -> None:
+        if self._buf is None:
+            return
+        owner = self._lock is None
+        if owner:
+            struct.pack_into('<B', self._buf, _CLOSED_OFFSET, 1)
+        self._buf.release()
+        self._buf = None
+        self._shm.close()
+        os.close(self._fifo)
+        if owner:
+            # unlink unregisters the segment from the resource tracker again
+            resource_tracker.register(self._shm._name, 'shared_memory')
+            self._shm.unlink()
+            _, fifo_path, lock_path = _paths(self._name)
+            for path in (fifo_path, lock_path):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+        else:
+            os.close(self._lock)
+
+    def __wake_reader(self) -> None:
+        try:
+            os.write(self._fifo, b'\0')
+        except BlockingIOError:
+            # the pipe is full of wakeups the reader has not consumed yet, it wakes up anyway
+            pass
+        except BrokenPipeError:
+            # only the reader holds the pipe open for reading, it exited without closing the ring
+            raise ConnectionResetError('Shared memory endpoint %s is gone' % self._name)
+
+    def __copy_in(self, position: int, data: bytes) -> None:
+        start = _HEADER_SIZE + position % self._capacity
+        first = min(len(data), _HEADER_SIZE + self._capacity - start)
+        self._buf[start:start + first] = data[:first]
+        if first < len(data):
+            self._buf[_HEADER_SIZE:_HEADER_SIZE + len(data) - first] = data[first:]
+
+    def __copy_out(self, position: int, length: int) -> bytes:
+        start = _HEADER_SIZE + position % self._capacity
+        first = min(length, _HEADER_SIZE + self._capacity - start)
+        data = bytes(self._buf[start:start + first])
+        if first < length:
+            data += bytes(self._buf[_HEADER_SIZE:_HEADER_SIZE + length - first])
+        return data
+
+
+class ShmServer:
+    """Feeds the batches written to the ring of a node to its EndpointReader, the shared memory counterpart of the
+    gRPC server."""
+
+    def __init__(self, endpoint_reader, name: str, capacity: int, serializer_id: int):
+        self._logger = log.create_logger(logging.INFO, context=ShmServer)
+        self._endpoint_reader = endpoint_reader
+        self._name = name
+        self._capacity = capacity
+        self._serializer_id = serializer_id
+        self._ring = None
+        self._loop = None
+        self._readable = None
+        self._closed = None
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_event_loop()
+        self._readable = asyncio.Event()
+        self._closed = asyncio.Event()
+        self._ring = ShmRing.create(self._name, self._capacity, self._serializer_id)
+        self._loop.add_reader(self._ring.fileno(), self._readable.set)
+        self._loop.create_task(self.__serve())
+
+    def close(self) -> None:
+        if self._loop is not None and not self._closed.is_set():
+            self._loop.call_soon_threadsafe(self.__close)
+
+    async def wait_closed(self) -> None:
+        await self._closed.wait()
+
+    async def __serve(self) -> None:
+        pids = self._endpoint_reader.pid_cache()
+        while not self._closed.is_set():
+            await self._readable.wait()
+            self._readable.clear()
+            if self._ring.closed:
+                return
+            for data in self._ring.read():
+                if self._endpoint_reader.suspended:
+                    # read only to make room for the writers, like the batches of a suspended gRPC stream
+                    continue
+                try:
+                    await self._endpoint_reader.receive_batch(MessageBatch.FromString(data), pids)
+                except Exception:
+                    self._logger.exception(f'Failed to receive a batch on {self._name}')
+
+    def __close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._loop.remove_reader(self._ring.fileno())
+        self._ring.close()
+        self._closed.set()
+        self._readable.set()
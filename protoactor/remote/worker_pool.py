@@ -0,0 +1,333 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import struct
+import threading
+from collections import deque
+from datetime import timedelta
+from typing import Callable, List, Optional, Tuple
+
+import protoactor.actor.message_envelope as proto
+from protoactor.actor import log
+from protoactor.actor.actor_context import GlobalRootContext
+from protoactor.actor.process import AbstractProcess, ProcessRegistry
+from protoactor.actor.props import Props
+from protoactor.actor.protos_pb2 import PID, Watch, Unwatch, Stop, Terminated
+from protoactor.actor.supervision import Supervision
+from protoactor.mailbox.dispatcher import Dispatchers
+from protoactor.remote.protos_remote_pb2 import MessageBatch, MessageEnvelope, MessageHeader, ActorPidRequest
+from protoactor.remote.remote import Activator
+from protoactor.remote.serialization import Serialization
+
+
+_LENGTH = struct.Struct('<I')
+
+
+class _WriteProtocol(asyncio.Protocol):
+    def __init__(self, writable: asyncio.Event):
+        self._writable = writable
+
+    def pause_writing(self) -> None:
+        self._writable.clear()
+
+    def resume_writing(self) -> None:
+        self._writable.set()
+
+    def connection_lost(self, exc) -> None:
+        self._writable.set()
+
+
+class _ReadProtocol(asyncio.Protocol):
+    def __init__(self, frames: asyncio.Queue):
+        self._frames = frames
+        self._buffer = bytearray()
+
+    def data_received(self, data: bytes) -> None:
+        buffer = self._buffer
+        buffer += data
+        while len(buffer) >= _LENGTH.size:
+            length = _LENGTH.unpack_from(buffer)[0]
+            if len(buffer) < _LENGTH.size + length:
+                break
+            self._frames.put_nowait(bytes(buffer[_LENGTH.size:_LENGTH.size + length]))
+            del buffer[:_LENGTH.size + length]
+
+    def connection_lost(self, exc) -> None:
+        self._frames.put_nowait(None)
+
+
+class WorkerLink(AbstractProcess):
+    """Connects two nodes of a worker pool through a pair of one way pipes.
+
+    The pipes are read and written through transports on the loop running run_async. Senders only queue their
+    messages, the loop coalesces everything queued into one MessageBatch frame per target address, prefixed with that
+    address, so a node can forward messages addressed to nodes it is not linked with. The link is the process of
+    every PID it forwards to.
+    """
+
+    def __init__(self, reader, writer):
+        self._logger = log.create_logger(logging.INFO, context=WorkerLink)
+        self._reader = reader
+        self._writer = writer
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._flush_scheduled = False
+        self._loop = None
+        self._transport = None
+        self._writable = None
+
+    async def send_user_message(self, pid: 'PID', message: object, sender: 'PID' = None) -> None:
+        self.post(pid, message)
+
+    async def send_system_message(self, pid: 'PID', message: object) -> None:
+        self.post(pid, message)
+
+    def post(self, pid: 'PID', message: object) -> None:
+        with self._lock:
+            self._pending.append((pid, message))
+            if self._flush_scheduled or self._loop is None:
+                return
+            self._flush_scheduled = True
+        self._loop.call_soon_threadsafe(self.__schedule_flush)
+
+    def close(self) -> None:
+        with self._lock:
+            loop = self._loop
+        if loop is None:
+            self._writer.close()
+            self._reader.close()
+        else:
+            try:
+                # the other end sees end of file once buffered frames are written, then closes its own writer
+                loop.call_soon_threadsafe(self._transport.close)
+            except RuntimeError:
+                # the loop ended in the meantime, along with the link
+                pass
+
+    async def run_async(self) -> None:
+        # runs until the other end closes its writer
+        loop = asyncio.get_event_loop()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        frames = asyncio.Queue()
+        self._transport, _ = await loop.connect_write_pipe(lambda: _WriteProtocol(self._writable), self._writer)
+        read_transport, _ = await loop.connect_read_pipe(lambda: _ReadProtocol(frames), self._reader)
+
+        with self._lock:
+            self._loop = loop
+            flush = bool(self._pending) and not self._flush_scheduled
+            self._flush_scheduled = self._flush_scheduled or flush
+        if flush:
+            self.__schedule_flush()
+
+        try:
+            while True:
+                frame = await frames.get()
+                if frame is None:
+                    return
+                try:
+                    await self.__deliver(frame)
+                except Exception:
+                    self._logger.exception('Failed to deliver a batch')
+        finally:
+            with self._lock:
+                self._loop = None
+            read_transport.close()
+            self._transport.close()
+
+    def __schedule_flush(self) -> None:
+        asyncio.ensure_future(self.__flush_async())
+
+    async def __flush_async(self) -> None:
+        while True:
+            # while the pipe is full senders keep queueing, their messages go out in the next batches
+            await self._writable.wait()
+            with self._lock:
+                if not self._pending or self._transport.is_closing():
+                    self._flush_scheduled = False
+                    return
+                messages = list(self._pending)
+                self._pending.clear()
+            for frame in self.__frames(messages):
+                self._transport.write(frame)
+
+    @staticmethod
+    def __frames(messages) -> List[bytes]:
+        serialization = Serialization()
+        serializer_id = serialization.default_serializer_id
+        batches = {}
+        for pid, message in messages:
+            entry = batches.get(pid.address)
+            if entry is None:
+                entry = batches[pid.address] = ([], {}, {})
+            envelopes, target_names, type_names = entry
+
+            message, sender, header = proto.MessageEnvelope.unwrap(message)
+            type_name, serialize = serialization.get_serializer(message, serializer_id)
+            target_id = target_names.setdefault(pid.id, len(target_names))
+            type_id = type_names.setdefault(type_name, len(type_names))
+            envelopes.append(MessageEnvelope(type_id=type_id,
+                                             message_data=serialize(message),
+                                             target=target_id,
+                                             sender=sender,
+                                             serializer_id=serializer_id,
+                                             message_header=MessageHeader(header_data=header) if header else None))
+
+        frames = []
+        for address, (envelopes, target_names, type_names) in batches.items():
+            batch = MessageBatch()
+            batch.target_names.extend(target_names)
+            batch.type_names.extend(type_names)
+            batch.envelopes.extend(envelopes)
+            body = address.encode() + b'\n' + batch.SerializeToString()
+            frames.append(_LENGTH.pack(len(body)) + body)
+        return frames
+
+    @staticmethod
+    async def __deliver(frame: bytes) -> None:
+        serialization = Serialization()
+        registry = ProcessRegistry()
+        separator = frame.index(b'\n')
+        address = frame[:separator].decode()
+        batch = MessageBatch.FromString(frame[separator + 1:])
+        targets = []
+        for target_name in batch.target_names:
+            target = PID(address=address, id=target_name)
+            targets.append((target, registry.get(target)))
+
+        for envelope in batch.envelopes:
+            target, process = targets[envelope.target]
+            message = serialization.deserialize(batch.type_names[envelope.type_id], envelope.message_data,
+                                                envelope.serializer_id)
+
+            if isinstance(message, (Watch, Unwatch, Stop, Terminated)):
+                await process.send_system_message(target, message)
+            else:
+                header = None
+                if envelope.HasField('message_header'):
+                    header = proto.MessageHeader(envelope.message_header.header_data)
+                sender = envelope.sender if envelope.HasField('sender') else None
+                await process.send_user_message(target, proto.MessageEnvelope(message, sender, header))
+
+
+class WorkerPool:
+    """Runs actors in worker processes on this host, so CPU bound actors are not limited to the core of this one.
+
+    Worker N is addressed as '<name>-N' and behaves like a remote node: actors are spawned on it by kind and messages
+    reach it through the existing Serialization. The initializer runs in every worker before it accepts messages and
+    registers the kinds with Remote().register_known_kind, along with the descriptors of the messages they use. With
+    a fork context, kinds registered before start are inherited as well.
+
+    Workers only know the node that started them, messages between workers or to other nodes are forwarded by it.
+    """
+
+    def __init__(self, worker_count: int = None, initializer: Callable[..., None] = None, initargs: Tuple = (),
+                 name: str = 'worker', mp_context=None):
+        if worker_count is None:
+            worker_count = os.cpu_count() or 1
+        if worker_count <= 0:
+            raise ValueError('Worker count must be greater than zero')
+        self._logger = log.create_logger(logging.INFO, context=WorkerPool)
+        self._worker_count = worker_count
+        self._initializer = initializer
+        self._initargs = initargs
+        self._name = name
+        self._mp_context = mp_context if mp_context is not None else multiprocessing.get_context('spawn')
+        self._links = {}
+        self._processes = []
+        self._previous_address = None
+        self._next_worker = itertools.count()
+
+    @property
+    def addresses(self) -> List[str]:
+        return ['%s-%s' % (self._name, i) for i in range(1, self._worker_count + 1)]
+
+    def start(self, address: str = None) -> None:
+        """Starts the workers. They send replies to the address of this node, so a node which is not reachable
+        remotely, i.e. Remote was not started, has to pass the address it takes for the lifetime of the pool."""
+        registry = ProcessRegistry()
+        if address is not None and registry.address not in ('nonhost', address):
+            raise ValueError('Node already has the address %s' % registry.address)
+        if address is None and registry.address == 'nonhost':
+            # workers resolve 'nonhost' to themselves
+            raise ValueError('Start Remote before the worker pool or pass the address of this node')
+        if registry.address == 'nonhost':
+            self._previous_address = registry.address
+            registry.address = address
+
+        links = []
+        for worker_address in self.addresses:
+            parent_reader, worker_writer = self._mp_context.Pipe(duplex=False)
+            worker_reader, parent_writer = self._mp_context.Pipe(duplex=False)
+            process = self._mp_context.Process(target=_run_worker, daemon=True, name=worker_address,
+                                               args=(worker_address, worker_reader, worker_writer,
+                                                     self._initializer, self._initargs))
+            process.start()
+            worker_reader.close()
+            worker_writer.close()
+
+            link = WorkerLink(parent_reader, parent_writer)
+            self._links[worker_address] = link
+            self._processes.append(process)
+            links.append(link)
+
+        # a single loop serves the links to all workers
+        Dispatchers().default_dispatcher.schedule(_run_links_async, links=links)
+        registry.register_host_resolver(self.__resolve, first=True)
+        self._logger.debug(f'Started {self._worker_count} workers')
+
+    def shutdown(self, timeout: timedelta = timedelta(seconds=5)) -> None:
+        ProcessRegistry().unregister_host_resolver(self.__resolve)
+        # closing the writers ends the workers, which closes the pipes read by this node
+        for link in self._links.values():
+            link.close()
+        for process in self._processes:
+            process.join(timeout.total_seconds())
+            if process.is_alive():
+                process.terminate()
+        self._links.clear()
+        self._processes.clear()
+
+        if self._previous_address is not None:
+            ProcessRegistry().address = self._previous_address
+            self._previous_address = None
+        self._logger.debug('Stopped workers')
+
+    async def spawn_async(self, kind: str, timeout: timedelta = None):
+        addresses = self.addresses
+        address = addresses[next(self._next_worker) % len(addresses)]
+        return await self.spawn_named_async(address, '%s$%s' % (kind, ProcessRegistry().next_id()), kind, timeout)
+
+    async def spawn_named_async(self, address: str, name: str, kind: str, timeout: timedelta = None):
+        activator = PID(address=address, id='activator')
+        return await GlobalRootContext.request_future(activator, ActorPidRequest(name=name, kind=kind),
+                                                      timeout=timeout)
+
+    def __resolve(self, pid: 'PID') -> Optional[AbstractProcess]:
+        return self._links.get(pid.address)
+
+
+async def _run_links_async(links: List[WorkerLink]) -> None:
+    await asyncio.gather(*(link.run_async() for link in links))
+
+
+def _run_worker(address: str, reader, writer, initializer: Callable[..., None], initargs: Tuple) -> None:
+    asyncio.run(_serve_worker(address, reader, writer, initializer, initargs))
+
+
+async def _serve_worker(address: str, reader, writer, initializer: Callable[..., None], initargs: Tuple) -> None:
+    registry = ProcessRegistry()
+    registry.address = address
+    link = WorkerLink(reader, writer)
+    # every other address is reached through the node which started the worker
+    registry.register_host_resolver(lambda pid: link)
+
+    if initializer is not None:
+        initializer(*initargs)
+
+    props = Props().from_producer(Activator).with_guardian_supervisor_strategy(Supervision.always_restart_strategy)
+    GlobalRootContext.spawn_named(props, 'activator')
+
+    await link.run_async()
@@ -1,3 +1,4 @@
+import copy
 from typing import List, Callable, Any
 
 from protoactor.actor import PID
@@ -41,29 +42,37 @@ class ConsistentHashRouterState(RouterState):
     def __init__(self, hash_func: Callable[[str], int], replica_count: int):
         self._hash_func = hash_func
         self._replica_count = replica_count
-        self._hash_ring = None
-        self._routee_map = None
+        # the hash ring and the routee map of its nodes, replaced together with a single assignment, as
+        # messages are routed concurrently from the senders
+        self._routing = None
 
     def get_routees(self) -> List[PID]:
-        return list(self._routee_map.values())
+        return list(self._routing[1].values())
 
     def set_routees(self, routees: List[PID]) -> None:
-        self._routee_map = {}
-        nodes = []
-
-        for pid in routees:
-            node_name = pid.to_short_string()
-            nodes.append(node_name)
-            self._routee_map[node_name] = pid
-
-        self._hash_ring = HashRing(nodes, self._hash_func, self._replica_count)
+        routee_map = {pid.to_short_string(): pid for pid in routees}
+
+        if self._routing is None:
+            self._routing = (HashRing(list(routee_map), self._hash_func, self._replica_count), routee_map)
+            return
+
+        hash_ring, previous_map = self._routing
+        added = [node for node in routee_map if node not in previous_map]
+        removed = [node for node in previous_map if node not in routee_map]
+        # the ring senders may still be reading is left as it is, the copy starts from its nodes
+        hash_ring = copy.copy(hash_ring)
+        if added:
+            hash_ring.add_nodes(added)
+        if removed:
+            hash_ring.remove_nodes(removed)
+        self._routing = (hash_ring, routee_map)
 
     async def route_message(self, message: Any) -> None:
         msg, _, _ = MessageEnvelope.unwrap(message)
         if isinstance(msg, AbstractHashable):
             key = msg.hash_by()
-            node = self._hash_ring.get_node(key)
-            routee = self._routee_map[node]
+            hash_ring, routee_map = self._routing
+            routee = routee_map[hash_ring.get_node(key)]
             await GlobalRootContext.send(routee, message)
         else:
             raise AttributeError('Message of type %s does not implement AbstractHashable' % type(message).__name__)
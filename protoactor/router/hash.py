@@ -1,6 +1,8 @@
+import functools
 import hashlib
 import struct
-from typing import List, Callable
+from bisect import bisect_right
+from typing import List, Callable, Iterable, Tuple
 
 
 class MD5Hasher:
@@ -12,19 +14,50 @@ class MD5Hasher:
 
 
 class HashRing:
-    def __init__(self, nodes: List[str], hash_func: Callable[[str], int], replica_count: int) -> None:
-        self._ring = []
-        self._hash_func = hash_func
+    """Consistent hash ring backed by parallel sorted arrays of replica hashes and node names.
+
+    Adding or removing nodes builds new arrays and swaps them in with a single assignment, so lookups
+    running on other threads always see a consistent ring without taking a lock.
+    """
 
-        for node in nodes:
-            for count in range(replica_count):
-                hash_key = str(count) + node
-                self._ring.append((self._hash_func(hash_key), node))
+    def __init__(self, nodes: List[str], hash_func: Callable[[str], int], replica_count: int,
+                 cache_size: int = 1024) -> None:
+        self._hash_func = hash_func
+        self._replica_count = replica_count
+        self._cache_size = cache_size
+        self._ring = None
+        self.__set_ring(*self.__merge([], [], self.__replicas(nodes)))
 
-        self._ring.sort(key=lambda tup: tup[0])
+    @property
+    def nodes(self) -> List[str]:
+        return list(dict.fromkeys(self._ring[1]))
 
     def get_node(self, key: str) -> str:
-        node = next((t for t in self._ring if t[0] > self._hash_func(key)), None)
-        if node is not None:
-            return node[1]
-        return self._ring[0][1]
+        return self._ring[2](key)
+
+    def add_nodes(self, nodes: Iterable[str]) -> None:
+        keys, names, _ = self._ring
+        self.__set_ring(*self.__merge(keys, names, self.__replicas(nodes)))
+
+    def remove_nodes(self, nodes: Iterable[str]) -> None:
+        removed = set(nodes)
+        keys, names, _ = self._ring
+        ring = [(k, n) for k, n in zip(keys, names) if n not in removed]
+        self.__set_ring([k for k, _ in ring], [n for _, n in ring])
+
+    def __replicas(self, nodes: Iterable[str]) -> List[Tuple[int, str]]:
+        return [(self._hash_func(str(count) + node), node) for node in nodes for count in range(self._replica_count)]
+
+    @staticmethod
+    def __merge(keys: List[int], names: List[str], replicas: List[Tuple[int, str]]) -> Tuple[List[int], List[str]]:
+        ring = sorted(list(zip(keys, names)) + replicas, key=lambda tup: tup[0])
+        return [k for k, _ in ring], [n for _, n in ring]
+
+    def __set_ring(self, keys: List[int], names: List[str]) -> None:
+        hash_func = self._hash_func
+
+        def lookup(key: str) -> str:
+            i = bisect_right(keys, hash_func(key))
+            return names[i] if i < len(keys) else names[0]
+
+        self._ring = (keys, names, functools.lru_cache(maxsize=self._cache_size)(lookup))
@@ -1,3 +1,4 @@
+import itertools
 from typing import List, Any, Iterable
 
 from protoactor.actor import PID
@@ -27,7 +28,8 @@ class RoundRobinPoolRouterConfig(PoolRouterConfig):
 class RoundRobinState(RouterState):
     def __init__(self):
         self._routees = None
-        self._current_index = 0
+        # next() on itertools.count is atomic, messages can be routed from several threads at once
+        self._counter = itertools.count()
 
     def get_routees(self) -> List[PID]:
         return list(self._routees)
@@ -36,8 +38,7 @@ class RoundRobinState(RouterState):
         self._routees = routees
 
     async def route_message(self, message: Any) -> None:
-        i = self._current_index % len(self._routees)
-        self._current_index += 1
-        pid = self._routees[i]
+        routees = self._routees
+        pid = routees[next(self._counter) % len(routees)]
 
         await GlobalRootContext.send(pid, message)
\ No newline at end of file
@@ -1,4 +1,3 @@
-import threading
 from abc import abstractmethod, ABC
 
 from protoactor.actor import PID, ProcessRegistry
@@ -20,16 +19,21 @@ class RouterConfig:
     def create_router_state(self) -> RouterState:
         pass
 
+    def prepare(self, router: RouterState) -> bool:
+        # sets up the routees known before the router starts, returns True when messages can be routed right away
+        return False
+
     def props(self) -> Props:
         def spawn_router_process(name: str, props: Props, parent: PID) -> PID:
-            wg = threading.Event()
             router_state = self.create_router_state()
-            p = props.with_producer(lambda: RouterActor(self, router_state, wg))
+            p = props.with_producer(lambda: RouterActor(self, router_state, process))
 
             ctx = ActorContext(p, parent)
             mailbox = props.mailbox_producer()
             dispatcher = props.dispatcher
-            process = RouterProcess(router_state, mailbox, wg)
+            process = RouterProcess(router_state, mailbox)
+            if self.prepare(router_state):
+                process.started()
             pid, absent = ProcessRegistry().try_add(name, process)
             if not absent:
                 raise ProcessNameExistException(name, pid)
@@ -38,7 +42,6 @@ class RouterConfig:
             mailbox.register_handlers(ctx, dispatcher)
             mailbox.post_system_message(Started())
             mailbox.start()
-            wg.wait()
 
             return pid
 
@@ -49,10 +52,13 @@ class GroupRouterConfig(RouterConfig, ABC):
     def __init__(self):
         self._routees = None
 
+    def prepare(self, router: RouterState) -> bool:
+        router.set_routees(self._routees)
+        return True
+
     async def on_started(self, context: AbstractContext, router: RouterState) -> None:
         for pid in self._routees:
             await context.watch(pid)
-        router.set_routees(self._routees)
 
 
 class PoolRouterConfig(RouterConfig, ABC):
@@ -1,18 +1,117 @@
-from threading import Event
+import asyncio
+import threading
+import weakref
 
 from protoactor.actor import PID
-from protoactor.actor.process import ActorProcess
+from protoactor.actor.message_envelope import MessageEnvelope
+from protoactor.actor.messages import AutoReceiveMessage, PoisonPill
+from protoactor.actor.process import ActorProcess, DeadLettersProcess
 from protoactor.mailbox.mailbox import AbstractMailbox
+from protoactor.router.messages import RouterManagementMessage
 from protoactor.router.router_state import RouterState
 
 
+class RouterActorMessage:
+    """A message the router actor handles on behalf of its process.
+
+    release runs once, when the actor is done with the message or when the mailbox drops it without
+    delivering it, in which case the message is garbage collected.
+    """
+
+    __slots__ = ('message', 'release', '__weakref__')
+
+    def __init__(self, message: object, release, *args):
+        self.message = message
+        self.release = weakref.finalize(self, release, *args)
+        self.release.atexit = False
+
+
 class RouterProcess(ActorProcess):
-    def __init__(self, state: RouterState, mailbox: AbstractMailbox, wg: Event):
+    """Routes user messages directly from the sender through the router state.
+
+    Router management messages, poison pills and other auto receive messages still go through the router
+    actor. The sender of a management message is suspended, without blocking its event loop, until the
+    actor has applied it, so messages routed afterwards see the updated routees. Until the actor has
+    started, and while messages queued by then are not routed yet, user messages go through the actor too,
+    which keeps them in order without the spawner waiting for it.
+    """
+
+    def __init__(self, state: RouterState, mailbox: AbstractMailbox):
         super().__init__(mailbox)
         self._state = state
-        self._wg = wg
+        self._waiters = set()
+        # reentrant, as the mailbox may drop, and so release, a message while a sender posts under the lock
+        self._lock = threading.RLock()
+        self._started = False
+        self._stopped = False
+        self._queued_messages = 0
 
     async def send_user_message(self, pid: PID, message: object, sender: PID = None):
-        self._wg.clear()
-        await super(RouterProcess, self).send_user_message(pid, message)
-        self._wg.wait()
\ No newline at end of file
+        msg = MessageEnvelope.unwrap_message(message)
+        if isinstance(msg, RouterManagementMessage):
+            await self.__send_management_message(pid, message, sender)
+        elif isinstance(msg, (PoisonPill, AutoReceiveMessage)):
+            await super().send_user_message(pid, message, sender)
+        else:
+            if not self._started or self._queued_messages:
+                posted = None
+                with self._lock:
+                    if not self._started or self._queued_messages:
+                        self._queued_messages += 1
+                        posted = not self._stopped and self.__post(message, self.__queued_message_released)
+                        if not posted:
+                            self._queued_messages -= 1
+                if posted is not None:
+                    if not posted:
+                        await DeadLettersProcess().send_user_message(pid, message, sender)
+                    return
+            await self._state.route_message(message)
+
+    def started(self) -> None:
+        self._started = True
+
+    def stopped(self) -> None:
+        # management messages still in the mailbox are never applied, their senders are released
+        with self._lock:
+            self._stopped = True
+            waiters = list(self._waiters)
+            self._waiters.clear()
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(self.__set_done, waiter)
+
+    async def __send_management_message(self, pid: PID, message: object, sender: PID):
+        waiter = asyncio.get_event_loop().create_future()
+        with self._lock:
+            self._waiters.add(waiter)
+            posted = not self._stopped and self.__post(message, self.__management_message_released, waiter)
+            if not posted:
+                self._waiters.discard(waiter)
+        if posted:
+            await waiter
+        else:
+            await DeadLettersProcess().send_user_message(pid, message, sender)
+
+    def __post(self, message: object, release, *args) -> bool:
+        msg, sender, header = MessageEnvelope.unwrap(message)
+        router_message = RouterActorMessage(message, release, *args)
+        posted = self.mailbox.post_user_message(MessageEnvelope(router_message, sender, header))
+        if not posted:
+            # the sender undoes the bookkeeping of a rejected message itself
+            router_message.release.detach()
+        return posted
+
+    def __queued_message_released(self) -> None:
+        with self._lock:
+            self._queued_messages -= 1
+
+    def __management_message_released(self, waiter: asyncio.Future) -> None:
+        with self._lock:
+            if waiter not in self._waiters:
+                return
+            self._waiters.discard(waiter)
+        waiter.get_loop().call_soon_threadsafe(self.__set_done, waiter)
+
+    @staticmethod
+    def __set_done(waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            waiter.set_result(None)
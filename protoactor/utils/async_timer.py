@@ -32,3 +32,62 @@ class AsyncTimer(Thread):
         await asyncio.sleep(self.interval.total_seconds())
         if not self._cancelled:
             await self.function(*self.args, **self.kwargs)
+
+
+class DeadlineTimer:
+    """One-shot timer running on the event loop it is started from, without a thread of its own.
+
+    The single callback registered in the loop scheduler re-arms itself when it fires before the
+    current deadline. Pausing the timer while a message is processed and resetting it afterwards
+    keeps that callback scheduled and only moves the deadline, so the scheduler is touched again
+    only when the callback fires, when the interval was shortened or when the timer is cancelled.
+    """
+
+    def __init__(self, interval: timedelta, function, args=None, kwargs=None):
+        self.interval = interval
+        self.function = function
+        self.args = args if args is not None else []
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.loop = None
+        self._deadline = None
+        self._handle = None
+        self._task = None
+        self._cancelled = True
+
+    @property
+    def is_active(self) -> bool:
+        return not self._cancelled
+
+    def start(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        if self.loop is None:
+            self.loop = asyncio.get_event_loop()
+        self._cancelled = False
+        self._deadline = self.loop.time() + self.interval.total_seconds()
+        if self._handle is not None and self._handle.when() > self._deadline:
+            self._handle.cancel()
+            self._handle = None
+        if self._handle is None:
+            self._handle = self.loop.call_at(self._deadline, self.__on_deadline)
+
+    def pause(self) -> None:
+        # the callback stays scheduled and finds the timer inactive, unless a reset moves the deadline first
+        self._cancelled = True
+
+    def cancel(self) -> None:
+        self._cancelled = True
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def __on_deadline(self) -> None:
+        self._handle = None
+        if self._cancelled:
+            return
+        if self.loop.time() < self._deadline:
+            self._handle = self.loop.call_at(self._deadline, self.__on_deadline)
+            return
+        self._cancelled = True
+        self._task = asyncio.ensure_future(self.function(*self.args, **self.kwargs), loop=self.loop)
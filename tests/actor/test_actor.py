@@ -4,8 +4,18 @@ from datetime import timedelta
 
 import pytest
 
-from protoactor.actor.actor_context import RootContext
+from protoactor.actor import PID
+from protoactor.actor.actor import Actor
+from protoactor.actor.actor_context import RootContext, ActorContext
+from protoactor.actor.exceptions import ProcessNameExistException
+from protoactor.actor.message_envelope import MessageEnvelope
+from protoactor.actor.event_stream import GlobalEventStream
+from protoactor.actor.messages import Started, ReceiveTimeout, Stopping, Stopped, DeadLetterEvent
+from protoactor.actor.process import ProcessRegistry, DeadLettersProcess
 from protoactor.actor.props import Props
+from protoactor.mailbox.dispatcher import Dispatchers
+from protoactor.mailbox.mailbox import MailboxFactory
+from protoactor.utils.async_timer import DeadlineTimer
 
 context = RootContext()
 
@@ -44,4 +54,224 @@ async def test_request_actor_async_should_not_raise_timeout_exception_when_resul
     pid = context.spawn(props)
     reply = await context.request_future(pid, "hello", timedelta(seconds=1))
 
-    assert reply == "hey"
\ No newline at end of file
+    assert reply == "hey"
+
+@pytest.mark.asyncio
+async def test_receive_timeout_is_reset_by_messages():
+    timeouts = []
+
+    async def receive(ctx):
+        if isinstance(ctx.message, Started):
+            ctx.set_receive_timeout(timedelta(milliseconds=100))
+        elif isinstance(ctx.message, ReceiveTimeout):
+            timeouts.append(ctx.message)
+
+    pid = context.spawn(Props.from_func(receive))
+    for _ in range(5):
+        await context.send(pid, 'keep alive')
+        await asyncio.sleep(0.05)
+    assert timeouts == []
+
+    await asyncio.sleep(0.3)
+    assert len(timeouts) == 1
+
+
+@pytest.mark.asyncio
+async def test_shortened_receive_timeout_fires_at_new_duration():
+    timeouts = []
+
+    async def receive(ctx):
+        if isinstance(ctx.message, Started):
+            ctx.set_receive_timeout(timedelta(seconds=2))
+        elif ctx.message == 'shorten':
+            ctx.set_receive_timeout(timedelta(milliseconds=50))
+        elif isinstance(ctx.message, ReceiveTimeout):
+            timeouts.append(ctx.message)
+
+    pid = context.spawn(Props.from_func(receive))
+    await context.send(pid, 'shorten')
+    await asyncio.sleep(0.3)
+
+    assert len(timeouts) == 1
+
+
+@pytest.mark.asyncio
+async def test_receive_timeout_is_scheduled_once_across_many_messages(monkeypatch):
+    scheduled = []
+    call_at = asyncio.BaseEventLoop.call_at
+
+    def counting_call_at(loop, when, callback, *args, **kwargs):
+        if getattr(callback, '__func__', None) is DeadlineTimer._DeadlineTimer__on_deadline:
+            scheduled.append(when)
+        return call_at(loop, when, callback, *args, **kwargs)
+
+    async def receive(ctx):
+        if isinstance(ctx.message, Started):
+            ctx.set_receive_timeout(timedelta(seconds=10))
+        elif ctx.message == 'done?':
+            await ctx.respond('done')
+
+    monkeypatch.setattr(asyncio.BaseEventLoop, 'call_at', counting_call_at)
+    pid = context.spawn(Props.from_func(receive))
+    for _ in range(1000):
+        await context.send(pid, 'keep alive')
+    assert await context.request_future(pid, 'done?', timedelta(seconds=5)) == 'done'
+
+    assert len(scheduled) == 1
+    await context.stop(pid)
+
+
+@pytest.mark.asyncio
+async def test_spawn_many_by_count():
+    props = Props.from_func(hello_function).with_dispatcher(Dispatchers().pooled_dispatcher)
+    pids = context.spawn_many(props, 100)
+
+    assert len({pid.id for pid in pids}) == 100
+    for pid in pids:
+        assert await context.request_future(pid, "hello", timedelta(seconds=1)) == "hey"
+
+
+@pytest.mark.asyncio
+async def test_spawn_many_by_names_rejects_existing_names():
+    props = Props.from_func(hello_function).with_dispatcher(Dispatchers().pooled_dispatcher)
+    pids = context.spawn_many(props, ['spawn_many_1', 'spawn_many_2'])
+    assert [pid.id for pid in pids] == ['spawn_many_1', 'spawn_many_2']
+
+    with pytest.raises(ProcessNameExistException):
+        context.spawn_many(props, ['spawn_many_3', 'spawn_many_2'])
+    assert ProcessRegistry().get(PID(address=ProcessRegistry().address, id='spawn_many_3')) == DeadLettersProcess()
+
+
+@pytest.mark.asyncio
+async def test_actor_without_middleware_receives_its_own_context():
+    contexts = []
+
+    async def receive(ctx):
+        if isinstance(ctx.message, str):
+            contexts.append(ctx)
+            await ctx.respond("hey")
+
+    pid = context.spawn(Props.from_func(receive))
+
+    assert await context.request_future(pid, "hello", timedelta(seconds=1)) == "hey"
+    assert isinstance(contexts[0], ActorContext)
+    assert contexts[0]._extras is None
+
+
+@pytest.mark.asyncio
+async def test_actor_without_middleware_is_stopped_not_restarted():
+    received = []
+
+    async def receive(ctx):
+        received.append(type(ctx.message))
+
+    pid = context.spawn(Props.from_func(receive))
+    await asyncio.sleep(0.1)
+    # a plain stop, stop_future would watch the actor and so create its extras
+    await context.stop(pid)
+    await asyncio.sleep(0.1)
+
+    assert received == [Started, Stopping, Stopped]
+
+
+@pytest.mark.asyncio
+async def test_receive_and_sender_middleware_are_applied():
+    calls = []
+
+    def receive_middleware(next_receive):
+        async def receive(ctx, envelope):
+            calls.append(('receive', MessageEnvelope.unwrap_message(envelope)))
+            await next_receive(ctx, envelope)
+        return receive
+
+    def sender_middleware(next_send):
+        async def send(ctx, target, envelope):
+            calls.append(('send', MessageEnvelope.unwrap_message(envelope)))
+            await next_send(ctx, target, envelope)
+        return send
+
+    props = Props.from_func(hello_function) \
+        .with_receive_middleware([receive_middleware]) \
+        .with_sender_middleware([sender_middleware])
+    pid = context.spawn(props)
+
+    assert await context.request_future(pid, "hello", timedelta(seconds=1)) == "hey"
+    assert ('receive', 'hello') in calls
+    assert ('send', 'hey') in calls
+
+
+@pytest.mark.asyncio
+async def test_sync_actor_receives_messages_without_awaiting():
+    received = []
+
+    def counter(ctx):
+        message = ctx.message
+        if message == 'count?':
+            asyncio.ensure_future(ctx.send(ctx.sender, len(received)))
+        elif isinstance(message, int):
+            received.append(message)
+
+    pid = context.spawn(Props.from_sync_func(counter))
+    for i in range(100):
+        await context.send(pid, i)
+
+    assert await context.request_future(pid, 'count?', timedelta(seconds=1)) == 100
+    assert received == list(range(100))
+
+
+@pytest.mark.asyncio
+async def test_sync_actor_uses_async_path_with_middleware():
+    calls = []
+
+    def receive_middleware(next_receive):
+        async def receive(ctx, envelope):
+            calls.append(MessageEnvelope.unwrap_message(envelope))
+            await next_receive(ctx, envelope)
+        return receive
+
+    def echo(ctx):
+        if isinstance(ctx.message, str):
+            asyncio.ensure_future(ctx.send(ctx.sender, ctx.message))
+
+    pid = context.spawn(Props.from_sync_func(echo).with_receive_middleware([receive_middleware]))
+
+    assert await context.request_future(pid, 'hello', timedelta(seconds=1)) == 'hello'
+    assert 'hello' in calls
+
+
+@pytest.mark.asyncio
+async def test_plain_receive_returning_an_awaitable_is_awaited():
+    async def respond(ctx):
+        if isinstance(ctx.message, str):
+            await ctx.respond('hey')
+
+    class DecoratedActor(Actor):
+        # a plain function returning a coroutine, as decorators do, and not a SyncActor
+        def receive(self, ctx):
+            return respond(ctx)
+
+    pid = context.spawn(Props.from_producer(DecoratedActor))
+
+    assert await context.request_future(pid, 'hello', timedelta(seconds=1)) == 'hey'
+
+
+@pytest.mark.asyncio
+async def test_actor_sending_to_itself_with_a_full_bounded_mailbox_does_not_deadlock():
+    dead_letters = []
+
+    async def on_dead_letter(event):
+        dead_letters.append(event.message)
+
+    async def receive(ctx):
+        if ctx.message == 'fill':
+            for i in range(3):
+                await ctx.send(ctx.my_self, i)
+            await ctx.respond('filled')
+
+    subscription = GlobalEventStream.subscribe(on_dead_letter, DeadLetterEvent)
+    try:
+        pid = context.spawn(Props.from_func(receive).with_mailbox(lambda: MailboxFactory.create_bounded_mailbox(1)))
+        assert await context.request_future(pid, 'fill', timedelta(seconds=1)) == 'filled'
+        assert dead_letters == [1, 2]
+    finally:
+        subscription.unsubscribe()
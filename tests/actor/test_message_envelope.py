@@ -80,3 +80,32 @@ def test_unwrap_message(message_envelope):
 def test_unwrap_sender(message_envelope):
     sender = MessageEnvelope.unwrap_sender(message_envelope)
     assert sender == message_envelope.sender
+
+
+def test_with_methods_return_same_envelope_when_nothing_changes(message_envelope):
+    assert message_envelope.with_sender(message_envelope.sender) is message_envelope
+    assert message_envelope.with_message(message_envelope.message) is message_envelope
+    assert message_envelope.with_header(message_envelope.header) is message_envelope
+    assert message_envelope.with_headers({}) is message_envelope
+
+
+def test_with_headers_returns_same_envelope_without_header_when_nothing_changes():
+    envelope = MessageEnvelope("test", None, None)
+    assert envelope.with_headers() is envelope
+    assert envelope.with_headers({}) is envelope
+    assert envelope.header is None
+
+
+def test_extending_header_does_not_change_original_header(message_envelope):
+    envelope = message_envelope.with_header(key="Test Key", value="Test Value")
+    other = envelope.with_headers({"Test Key 1": "Test Value 1"})
+
+    assert len(message_envelope.header) == 0
+    assert dict(envelope.header) == {"Test Key": "Test Value"}
+    assert dict(other.header) == {"Test Key": "Test Value", "Test Key 1": "Test Value 1"}
+    assert envelope.with_header(key="Test Key", value="Test Value") is envelope
+
+
+def test_message_envelope_has_no_instance_dict(message_envelope):
+    with pytest.raises(AttributeError):
+        message_envelope.extra = 1
@@ -1,3 +1,11 @@
+from unittest import mock
+
+import pytest
+
+from protoactor.actor import PID
+from protoactor.actor.process import ActorProcess, ProcessRegistry, DeadLettersProcess
+
+
 # import pytest
 # from unittest import mock
 # from protoactor import pid
@@ -45,3 +53,29 @@
 #
 # def test_repr(mocked_pid):
 #     return str(mocked_pid) == "{} / {}".format(mocked_pid.address, mocked_pid.id)
+
+
+class RecordingProcess(ActorProcess):
+    def __init__(self):
+        super().__init__(mock.Mock())
+        self.messages = []
+
+    async def send_user_message(self, pid, message, sender=None):
+        self.messages.append(message)
+
+
+@pytest.mark.asyncio
+async def test_send_user_message_caches_process_until_it_is_removed():
+    process = RecordingProcess()
+    pid, _ = ProcessRegistry().try_add('cached_pid', process)
+
+    await pid.send_user_message('1')
+    with mock.patch.object(ProcessRegistry, 'get', side_effect=AssertionError):
+        await pid.send_user_message('2')
+    assert process.messages == ['1', '2']
+
+    ProcessRegistry().remove(pid)
+    with mock.patch.object(DeadLettersProcess, 'send_user_message') as dead_letters:
+        await pid.send_user_message('3')
+    assert process.messages == ['1', '2']
+    dead_letters.assert_called_once()
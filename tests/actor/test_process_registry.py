@@ -1,3 +1,4 @@
+import threading
 from unittest import mock
 
 import pytest
@@ -15,6 +16,12 @@ def nohost():
     return ProcessRegistry()
 
 
+@pytest.fixture
+def resolving_registry(nohost: ProcessRegistry):
+    yield nohost
+    del Singleton._instances[ProcessRegistry]
+
+
 @pytest.fixture
 def mock_process():
     return mock.Mock()
@@ -57,6 +64,32 @@ def test_get_nonhost(nohost: ProcessRegistry, mock_process):
     _pid, absent = ProcessRegistry().try_add('new_id', mock_process)
     assert ProcessRegistry().get(_pid) == mock_process
 
+
+def test_get_resolves_remote_address_once(resolving_registry: ProcessRegistry, mock_process):
+    resolved = []
+
+    def resolver(pid):
+        resolved.append(pid.id)
+        return mock_process
+
+    resolving_registry.address = 'local'
+    resolving_registry.register_host_resolver(resolver)
+
+    assert resolving_registry.get(PID(address='remote', id='1')) == mock_process
+    assert resolving_registry.get(PID(address='remote', id='2')) == mock_process
+    assert resolved == ['1']
+
+
+def test_get_local_address_skips_resolvers(resolving_registry: ProcessRegistry, mock_process):
+    resolver = mock.Mock(return_value=None)
+    resolving_registry.address = 'local'
+    resolving_registry.register_host_resolver(resolver)
+
+    _pid, absent = resolving_registry.try_add('new_id', mock_process)
+
+    assert resolving_registry.get(_pid) == mock_process
+    resolver.assert_not_called()
+
 # def test_get_sameaddress():
 #     test_pid = PID(address='address', id='id')
 #     lp  = ActorProcess(DefaultMailbox())
@@ -90,3 +123,35 @@ def test_get_nonhost(nohost: ProcessRegistry, mock_process):
 #     new_lp = pr.get(test_pid)
 #
 #     assert isinstance(new_lp, DeadLettersProcess) is True
+
+
+def test_try_add_is_atomic_across_threads(nohost: ProcessRegistry):
+    processes = [mock.Mock() for _ in range(8)]
+    results = []
+
+    def add(process):
+        results.append(nohost.try_add('contended_id', process)[1])
+
+    threads = [threading.Thread(target=add, args=(process,)) for process in processes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 1
+    assert nohost.get(PID(address=nohost.address, id='contended_id')) in processes
+
+
+def test_next_id_is_unique_across_threads(nohost: ProcessRegistry):
+    ids = []
+
+    def generate():
+        ids.extend(nohost.next_id() for _ in range(1000))
+
+    threads = [threading.Thread(target=generate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(ids)) == 4000
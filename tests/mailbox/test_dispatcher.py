@@ -0,0 +1,74 @@
+import threading
+
+import pytest
+
+from protoactor.actor.actor_context import RootContext
+from protoactor.actor.props import Props
+from protoactor.mailbox.dispatcher import PooledLoopDispatcher, Dispatchers, CurrentLoopDispatcher
+
+context = RootContext()
+
+
+async def reply_thread_name(ctx):
+    if isinstance(ctx.message, str):
+        await ctx.respond(threading.current_thread().name)
+
+
+def test_pooled_dispatcher_pool_size_must_be_positive():
+    with pytest.raises(ValueError):
+        PooledLoopDispatcher(pool_size=0)
+
+
+def test_pooled_dispatcher_is_shared():
+    assert Dispatchers().pooled_dispatcher is Dispatchers().pooled_dispatcher
+
+
+@pytest.mark.asyncio
+async def test_pooled_dispatcher_runs_actors_on_fixed_number_of_threads():
+    dispatcher = PooledLoopDispatcher(pool_size=2)
+    props = Props.from_func(reply_thread_name).with_dispatcher(dispatcher)
+    threads_before = threading.active_count()
+
+    pids = [context.spawn(props) for _ in range(20)]
+    names = [await context.request_future(pid, 'name') for pid in pids]
+
+    assert len(dispatcher.loops) == 2
+    assert set(names) == {'PooledLoopDispatcher-0', 'PooledLoopDispatcher-1'}
+    assert threading.active_count() - threads_before <= 2
+
+
+@pytest.mark.asyncio
+async def test_pooled_dispatcher_keeps_mailbox_on_same_loop():
+    dispatcher = PooledLoopDispatcher(pool_size=4)
+    props = Props.from_func(reply_thread_name).with_dispatcher(dispatcher)
+    pid = context.spawn(props)
+
+    names = {await context.request_future(pid, 'name') for _ in range(10)}
+
+    assert len(names) == 1
+
+
+@pytest.mark.asyncio
+async def test_current_loop_dispatcher_runs_actor_on_caller_thread():
+    props = Props.from_func(reply_thread_name).with_dispatcher(CurrentLoopDispatcher())
+    pid = context.spawn(props)
+
+    name = await context.request_future(pid, 'name')
+
+    assert name == threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_current_loop_dispatcher_ping_pong():
+    async def pong(ctx):
+        if isinstance(ctx.message, int):
+            await ctx.respond(ctx.message + 1)
+
+    props = Props.from_func(pong).with_dispatcher(Dispatchers().current_loop_dispatcher)
+    pid = context.spawn(props)
+
+    value = 0
+    for _ in range(100):
+        value = await context.request_future(pid, value)
+
+    assert value == 100
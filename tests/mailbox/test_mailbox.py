@@ -1,10 +1,162 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import asyncio
+
 import pytest
 
+from protoactor.actor.message_envelope import MessageEnvelope
+from protoactor.actor.message_header import MessageHeader
+from protoactor.actor.messages import SuspendMailbox, ResumeMailbox
 from protoactor.mailbox import mailbox
+from protoactor.mailbox.dispatcher import AbstractMessageInvoker, CurrentLoopDispatcher
+
+
+class RecordingInvoker(AbstractMessageInvoker):
+    def __init__(self):
+        self.user_messages = []
+        self.system_messages = []
+
+    async def invoke_system_message(self, msg):
+        self.system_messages.append(msg)
+
+    async def invoke_user_message(self, msg):
+        self.user_messages.append(msg)
+
+    async def escalate_failure(self, reason, msg):
+        pass
 
 
 def test_create_abstract_mailbox():
     with pytest.raises(TypeError):
         _mailbox = mailbox.AbstractMailbox()
+
+
+class RejectingMailbox(mailbox.AbstractMailbox):
+    def post_user_message(self, msg) -> bool:
+        return False
+
+    def post_system_message(self, msg):
+        pass
+
+    def register_handlers(self, invoker, dispatcher):
+        pass
+
+    def start(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_post_user_message_async_reports_rejection_of_synchronous_post():
+    assert await RejectingMailbox().post_user_message_async('rejected') is False
+
+
+@pytest.mark.asyncio
+async def test_mailbox_drains_user_messages_in_order():
+    invoker = RecordingInvoker()
+    _mailbox = mailbox.MailboxFactory.create_unbounded_mailbox()
+    _mailbox.register_handlers(invoker, CurrentLoopDispatcher(throughput=10))
+
+    for i in range(25):
+        _mailbox.post_user_message(i)
+    await asyncio.sleep(0.1)
+
+    assert invoker.user_messages == list(range(25))
+
+
+@pytest.mark.asyncio
+async def test_suspended_mailbox_keeps_drained_messages_until_resumed():
+    invoker = RecordingInvoker()
+    _mailbox = mailbox.MailboxFactory.create_unbounded_mailbox()
+    _mailbox.register_handlers(invoker, CurrentLoopDispatcher())
+    await asyncio.sleep(0)
+
+    _mailbox.post_system_message(SuspendMailbox())
+    for i in range(5):
+        _mailbox.post_user_message(i)
+    await asyncio.sleep(0.1)
+    assert invoker.user_messages == []
+
+    _mailbox.post_system_message(ResumeMailbox())
+    await asyncio.sleep(0.1)
+    assert invoker.user_messages == list(range(5))
+
+
+def test_bounded_mailbox_drop_newest():
+    _mailbox = mailbox.MailboxFactory.create_bounded_mailbox(
+        2, overflow_strategy=mailbox.BoundedMailboxOverflowStrategy.DROP_NEWEST)
+
+    for i in range(4):
+        assert _mailbox.post_user_message(i) is True
+
+    assert _mailbox._user_messages_queue.pop_many(10) == [0, 1]
+
+
+def test_bounded_mailbox_drop_oldest():
+    _mailbox = mailbox.MailboxFactory.create_bounded_mailbox(
+        2, overflow_strategy=mailbox.BoundedMailboxOverflowStrategy.DROP_OLDEST)
+
+    for i in range(4):
+        assert _mailbox.post_user_message(i) is True
+
+    assert _mailbox._user_messages_queue.pop_many(10) == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_bounded_mailbox_dead_letter_rejects_overflow():
+    _mailbox = mailbox.MailboxFactory.create_bounded_mailbox(
+        1, overflow_strategy=mailbox.BoundedMailboxOverflowStrategy.DEAD_LETTER)
+
+    assert await _mailbox.post_user_message_async(1) is True
+    assert await _mailbox.post_user_message_async(2) is False
+
+
+@pytest.mark.asyncio
+async def test_bounded_mailbox_wait_suspends_sender_until_capacity_frees_up():
+    invoker = RecordingInvoker()
+    _mailbox = mailbox.MailboxFactory.create_bounded_mailbox(
+        2, overflow_strategy=mailbox.BoundedMailboxOverflowStrategy.WAIT)
+
+    senders = [asyncio.ensure_future(_mailbox.post_user_message_async(i)) for i in range(5)]
+    await asyncio.sleep(0.01)
+    assert sum(sender.done() for sender in senders) == 2
+
+    _mailbox.register_handlers(invoker, CurrentLoopDispatcher(throughput=1))
+    assert all(await asyncio.wait_for(asyncio.gather(*senders), 1))
+    await asyncio.sleep(0.01)
+
+    assert sorted(invoker.user_messages) == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_priority_mailbox_delivers_priority_messages_first():
+    invoker = RecordingInvoker()
+    _mailbox = mailbox.MailboxFactory.create_unbounded_priority_mailbox()
+
+    for i in range(5):
+        _mailbox.post_user_message(i)
+    _mailbox.post_user_message(MessageEnvelope('health', header=MessageHeader({'priority': '7'})))
+    _mailbox.register_handlers(invoker, CurrentLoopDispatcher())
+    await asyncio.sleep(0.1)
+
+    assert MessageEnvelope.unwrap_message(invoker.user_messages[0]) == 'health'
+    assert invoker.user_messages[1:] == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_priority_mailbox_delivers_priority_message_posted_while_processing_next():
+    _mailbox = mailbox.MailboxFactory.create_unbounded_priority_mailbox()
+    health = MessageEnvelope('health', header=MessageHeader({'priority': '7'}))
+
+    class PostingInvoker(RecordingInvoker):
+        async def invoke_user_message(self, msg):
+            if msg == 0:
+                _mailbox.post_user_message(health)
+            await super().invoke_user_message(msg)
+
+    invoker = PostingInvoker()
+    for i in range(5):
+        _mailbox.post_user_message(i)
+    _mailbox.register_handlers(invoker, CurrentLoopDispatcher())
+    await asyncio.sleep(0.1)
+
+    assert invoker.user_messages == [0, health, 1, 2, 3, 4]
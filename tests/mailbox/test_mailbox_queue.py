@@ -1,7 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import asyncio
+
 import pytest
 
+from protoactor.actor.message_envelope import MessageEnvelope
+from protoactor.actor.message_header import MessageHeader
+from protoactor.actor.messages import AbstractPriorityMessage
 from protoactor.mailbox import queue
 
 
@@ -31,3 +36,86 @@ def test_unbounded_mailbox_queue_has_message_empty(unbounded_queue):
 def test_create_abstract_queue():
     with pytest.raises(TypeError):
         _queue = queue.AbstractQueue()
+
+
+def test_unbounded_mailbox_queue_pop_many_keeps_order(unbounded_queue):
+    for i in range(5):
+        unbounded_queue.push(i)
+    assert unbounded_queue.pop_many(3) == [0, 1, 2]
+    assert unbounded_queue.pop_many(3) == [3, 4]
+    assert unbounded_queue.has_messages() is False
+
+
+def test_unbounded_mailbox_queue_pop_many_empty(unbounded_queue):
+    assert unbounded_queue.pop_many(10) == []
+
+
+@pytest.fixture
+def bounded_queue():
+    return queue.BoundedMailboxQueue(2)
+
+
+def test_bounded_mailbox_queue_size_must_be_positive():
+    with pytest.raises(ValueError):
+        queue.BoundedMailboxQueue(0)
+
+
+def test_bounded_mailbox_queue_rejects_when_full(bounded_queue):
+    assert bounded_queue.push("1") is True
+    assert bounded_queue.push("2") is True
+    assert bounded_queue.is_full() is True
+    assert bounded_queue.push("3") is False
+    assert bounded_queue.pop_many(3) == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_bounded_mailbox_queue_wait_for_capacity(bounded_queue):
+    bounded_queue.push("1")
+    bounded_queue.push("2")
+
+    waiter = asyncio.ensure_future(bounded_queue.wait_for_capacity())
+    await asyncio.sleep(0.01)
+    assert waiter.done() is False
+
+    assert bounded_queue.pop() == "1"
+    await asyncio.wait_for(waiter, 1)
+
+
+class Urgent(AbstractPriorityMessage):
+    @property
+    def priority(self) -> int:
+        return 7
+
+
+def test_priority_mailbox_queue_pops_higher_priority_first():
+    priority_queue = queue.PriorityMailboxQueue()
+    priority_queue.push("bulk-1")
+    priority_queue.push("bulk-2")
+    urgent = Urgent()
+    priority_queue.push(urgent)
+    header = MessageEnvelope("header", header=MessageHeader({queue.PRIORITY_HEADER_KEY: '6'}))
+    priority_queue.push(header)
+
+    assert [priority_queue.pop() for _ in range(4)] == [urgent, header, "bulk-1", "bulk-2"]
+    assert priority_queue.has_messages() is False
+
+
+def test_priority_mailbox_queue_pop_many_takes_one_message():
+    priority_queue = queue.PriorityMailboxQueue()
+    priority_queue.push("bulk-1")
+    priority_queue.push("bulk-2")
+
+    assert priority_queue.pop_many(10) == ["bulk-1"]
+    assert priority_queue.pop_many(10) == ["bulk-2"]
+    assert priority_queue.pop_many(10) == []
+
+
+def test_priority_mailbox_queue_clamps_priority():
+    priority_queue = queue.PriorityMailboxQueue(priority_levels=2)
+    assert priority_queue.get_priority(Urgent()) == 1
+    assert priority_queue.get_priority(MessageEnvelope("low", header=MessageHeader({'priority': '-5'}))) == 0
+
+
+def test_priority_mailbox_queue_ignores_priority_header_which_is_not_a_number():
+    priority_queue = queue.PriorityMailboxQueue(priority_levels=4)
+    assert priority_queue.get_priority(MessageEnvelope("high", header=MessageHeader({'priority': 'high'}))) == 2
@@ -0,0 +1,57 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from protoactor.mailbox.dispatcher import CurrentLoopDispatcher
+from protoactor.mailbox.mailbox import MailboxFactory
+from protoactor.mailbox.mailbox_statistics import MailBoxStatistics
+from tests.mailbox.test_mailbox import RecordingInvoker
+
+
+def test_statistics_track_queue_depth():
+    stats = MailBoxStatistics()
+    for i in range(3):
+        stats.message_posted(i)
+    stats.message_received(0)
+
+    assert stats.posted_count == 3
+    assert stats.received_count == 1
+    assert stats.queue_depth == 2
+    assert stats.max_queue_depth == 3
+
+
+def test_statistics_record_latency_histogram():
+    stats = MailBoxStatistics()
+    stats.message_posted('message')
+    stats.message_received('message')
+
+    assert sum(stats.latency_histogram) == 1
+    assert stats.latency_percentile(0.99) > timedelta()
+
+
+def test_statistics_skip_latency_of_overwritten_posts():
+    stats = MailBoxStatistics(ring_size=2)
+    for i in range(3):
+        stats.message_posted(i)
+    stats.message_received(0)
+
+    assert sum(stats.latency_histogram) == 0
+    assert stats.latency_percentile(0.5) == timedelta()
+
+
+@pytest.mark.asyncio
+async def test_mailbox_reports_to_statistics():
+    stats = MailBoxStatistics()
+    _mailbox = MailboxFactory.create_unbounded_mailbox(stats)
+    _mailbox.register_handlers(RecordingInvoker(), CurrentLoopDispatcher())
+    _mailbox.start()
+
+    for i in range(10):
+        _mailbox.post_user_message(i)
+    await asyncio.sleep(0.1)
+
+    assert stats.received_count == 10
+    assert stats.queue_depth == 0
+    assert stats.empty_count >= 1
+    assert stats.messages_per_second > 0
@@ -28,7 +28,7 @@ class RemoteManager():
         process = subprocess.Popen(['python', str(node_path), '--host', str(host), '--port', str(port)],
                                    stdout=subprocess.PIPE,
                                    stdin=subprocess.PIPE)
-        address = '%s:%s' % (host, port)
+        address = host if host.startswith(('unix:', 'shm://')) else '%s:%s' % (host, port)
         self.__nodes[address] = process
         time.sleep(1)
         return address, process
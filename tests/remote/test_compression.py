@@ -0,0 +1,46 @@
+from protoactor.remote.compression import BatchCompression, ZlibCompressionCodec
+from protoactor.remote.protos_remote_pb2 import MessageBatch, MessageEnvelope
+
+
+def create_batch(count):
+    batch = MessageBatch(type_names=['actor.PID'], target_names=['target'])
+    batch.envelopes.extend(MessageEnvelope(message_data=b'hello world' * 10) for _ in range(count))
+    return batch
+
+
+def test_negotiate_picks_first_offered_supported_codec():
+    compression = BatchCompression([ZlibCompressionCodec()], 0)
+    assert compression.negotiate(['lz4', 'zlib']) == 'zlib'
+    assert compression.negotiate(['lz4']) is None
+    assert BatchCompression([], 0).negotiate(['zlib']) is None
+
+
+def test_batches_below_threshold_are_not_compressed():
+    compression = BatchCompression([ZlibCompressionCodec()], 1024)
+    batch = create_batch(1)
+    assert compression.compress(batch, 'zlib') is batch
+
+
+def test_batch_of_threshold_size_is_compressed():
+    batch = create_batch(100)
+    compression = BatchCompression([ZlibCompressionCodec()], batch.ByteSize())
+    assert compression.compress(batch, 'zlib').compression_codec == 'zlib'
+    assert BatchCompression([ZlibCompressionCodec()], batch.ByteSize() + 1).compress(batch, 'zlib') is batch
+
+
+def test_compressed_batch_can_be_decompressed():
+    compression = BatchCompression([ZlibCompressionCodec()], 1024)
+    batch = create_batch(100)
+
+    compressed = compression.compress(batch, 'zlib')
+
+    assert compressed.compression_codec == 'zlib'
+    assert len(compressed.envelopes) == 0
+    assert compressed.ByteSize() < batch.ByteSize()
+    assert compression.decompress(compressed) == batch
+
+
+def test_uncompressed_batch_is_decompressed_as_is():
+    compression = BatchCompression([ZlibCompressionCodec()], 1024)
+    batch = create_batch(1)
+    assert compression.decompress(batch) is batch
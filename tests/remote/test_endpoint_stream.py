@@ -0,0 +1,192 @@
+import asyncio
+import uuid
+
+import pytest
+from grpclib.exceptions import StreamTerminatedError
+
+from protoactor.actor.actor_context import RootContext
+from protoactor.actor.props import Props
+from protoactor.remote.compression import BatchCompression
+from protoactor.remote.protos_remote_pb2 import MessageBatch, MessageEnvelope, Unit
+from protoactor.remote.remote import EndpointReader, EndpointWriter, PID_CACHE_SIZE
+from protoactor.remote.serialization import Serialization
+from protoactor.remote.shm_transport import ShmRing
+from tests.remote.messages.protos_pb2 import Ping, DESCRIPTOR
+
+context = RootContext()
+
+
+def ping_batch(target_id, text):
+    Serialization().register_file_descriptor(DESCRIPTOR)
+    return MessageBatch(target_names=[target_id],
+                        type_names=['remote_test_messages.Ping'],
+                        envelopes=[MessageEnvelope(type_id=0, target=0, serializer_id=0,
+                                                   message_data=Ping(message=text).SerializeToString())])
+
+
+class FakeServerStream:
+    def __init__(self, batches, events):
+        self._batches = batches
+        self._events = events
+
+    async def __aiter__(self):
+        for batch in self._batches:
+            self._events.append(('batch', batch.envelopes[0].message_data))
+            yield batch
+
+    async def send_message(self, message):
+        assert isinstance(message, Unit)
+        self._events.append(('ack',))
+
+
+class FakeClientStream:
+    def __init__(self, fail_on_send=False):
+        self.sent = []
+        self._fail_on_send = fail_on_send
+        self._acks = asyncio.Queue()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def send_request(self):
+        pass
+
+    async def send_message(self, batch):
+        if self._fail_on_send:
+            raise StreamTerminatedError('Stream closed')
+        self.sent.append(batch)
+        await self._acks.put(Unit())
+
+    async def recv_message(self):
+        return await self._acks.get()
+
+
+class FakeReceive:
+    def __init__(self, streams):
+        self.streams = streams
+        self.opened = 0
+
+    def open(self):
+        stream = self.streams[self.opened]
+        self.opened += 1
+        return stream
+
+
+class FakeClient:
+    def __init__(self, *streams):
+        self.Receive = FakeReceive(list(streams))
+
+
+async def spawn_collector():
+    received = []
+
+    async def receive(ctx):
+        if isinstance(ctx.message, Ping):
+            received.append(ctx.message.message)
+
+    pid = context.spawn(Props.from_func(receive))
+    await asyncio.sleep(0.05)
+    return pid, received
+
+
+@pytest.mark.asyncio
+async def test_reader_acknowledges_every_batch_once_after_delivering_it():
+    pid, received = await spawn_collector()
+    events = []
+    batches = [ping_batch(pid.id, 'a'), ping_batch(pid.id, 'b')]
+
+    await EndpointReader(BatchCompression([], 1024)).Receive(FakeServerStream(batches, events))
+    await asyncio.sleep(0.05)
+
+    assert [event[0] for event in events] == ['batch', 'ack', 'batch', 'ack']
+    assert received == ['a', 'b']
+
+
+@pytest.mark.asyncio
+async def test_suspended_reader_drops_batches_with_a_single_ack():
+    pid, received = await spawn_collector()
+    events = []
+    reader = EndpointReader(BatchCompression([], 1024))
+    reader.suspend(True)
+
+    await reader.Receive(FakeServerStream([ping_batch(pid.id, 'a')], events))
+    await asyncio.sleep(0.05)
+
+    assert [event[0] for event in events] == ['batch', 'ack']
+    assert received == []
+
+
+def test_reader_pid_cache_is_bounded():
+    pids = EndpointReader.pid_cache()
+    first = pids('first')
+    assert pids('first') is first
+    for i in range(PID_CACHE_SIZE * 2):
+        pids(str(i))
+    assert pids.cache_info().currsize == PID_CACHE_SIZE
+    assert pids('first') is not first
+    assert pids('first') == first
+
+
+@pytest.mark.asyncio
+async def test_writer_sends_batches_without_waiting_for_acks():
+    stream = FakeClientStream()
+    writer = EndpointWriter('127.0.0.1:1', None, None, None, BatchCompression([], 1024))
+    writer._client = FakeClient(stream)
+    try:
+        for text in ('a', 'b', 'c'):
+            await writer._EndpointWriter__send_envelopes_async(ping_batch('target', text))
+        assert [Ping.FromString(b.envelopes[0].message_data).message for b in stream.sent] == ['a', 'b', 'c']
+        assert writer._client.Receive.opened == 1
+    finally:
+        await writer._EndpointWriter__close_stream_async()
+
+
+@pytest.mark.asyncio
+async def test_writer_reconnects_once_when_stream_breaks():
+    broken = FakeClientStream(fail_on_send=True)
+    healthy = FakeClientStream()
+    writer = EndpointWriter('127.0.0.1:1', None, None, None, BatchCompression([], 1024))
+    writer._client = FakeClient(broken, healthy)
+    try:
+        await writer._EndpointWriter__send_envelopes_async(ping_batch('target', 'a'))
+        assert writer._client.Receive.opened == 2
+        assert len(healthy.sent) == 1
+    finally:
+        await writer._EndpointWriter__close_stream_async()
+
+
+@pytest.mark.asyncio
+async def test_writer_splits_batches_larger_than_the_ring():
+    ring = ShmRing.create('test-%s' % uuid.uuid4().hex, 256, 0)
+    writer = EndpointWriter('shm://' + ring._name, None, None, None, BatchCompression([], 1024))
+    writer._ring = ShmRing.attach(ring._name)
+    records = []
+
+    async def read():
+        while True:
+            records.extend(ring.read())
+            await asyncio.sleep(0.001)
+
+    reader = asyncio.ensure_future(read())
+    try:
+        batch = MessageBatch(target_names=['target'], type_names=['remote_test_messages.Ping'])
+        batch.envelopes.extend(MessageEnvelope(type_id=0, target=0, serializer_id=0,
+                                               message_data=Ping(message='%20s' % i).SerializeToString())
+                               for i in range(40))
+        # a single message larger than the ring is dropped
+        batch.envelopes.add(type_id=0, target=0, serializer_id=0, message_data=b'x' * 512)
+        await writer._EndpointWriter__send_envelopes_async(batch)
+        await asyncio.sleep(0.05)
+
+        assert len(records) > 1
+        assert all(len(record) <= 252 for record in records)
+        envelopes = [envelope for record in records for envelope in MessageBatch.FromString(record).envelopes]
+        assert [Ping.FromString(envelope.message_data).message.strip() for envelope in envelopes] == \
+               [str(i) for i in range(40)]
+    finally:
+        reader.cancel()
+        await writer._EndpointWriter__close_stream_async()
+        ring.close()
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from protoactor.actor import PID
+from protoactor.mailbox.dispatcher import Dispatchers
+from protoactor.remote.messages import RemoteDeliver
+from protoactor.remote.remote import BatchLinger, EndpointWriterMailbox
+from tests.mailbox.test_mailbox import RecordingInvoker
+
+
+def create_remote_deliver(i):
+    return RemoteDeliver(None, PID(address='remote', id=str(i)), PID(address='remote', id='target'), None, -1)
+
+
+def test_batch_linger_does_not_wait_without_observed_traffic():
+    linger = BatchLinger(0.01, 100)
+    assert linger.delay(1) == 0
+
+
+def test_batch_linger_waits_when_more_messages_are_expected():
+    linger = BatchLinger(0.01, 100)
+    for i in range(50):
+        linger.flushed(10, i * 0.001)
+
+    # about 10000 messages per second, filling the batch takes 9ms
+    assert 0.008 < linger.delay(10) <= 0.01
+    assert linger.delay(100) == 0
+
+
+def test_batch_linger_does_not_wait_under_light_load():
+    linger = BatchLinger(0.01, 100)
+    for i in range(50):
+        linger.flushed(1, i * 1.0)
+
+    assert linger.delay(1) == 0
+
+
+def test_batch_linger_is_disabled_without_max_linger():
+    linger = BatchLinger(0, 100)
+    for i in range(50):
+        linger.flushed(10, i * 0.001)
+
+    assert linger.delay(1) == 0
+
+
+@pytest.mark.asyncio
+async def test_endpoint_writer_mailbox_batches_messages_posted_within_linger_window():
+    invoker = RecordingInvoker()
+    mailbox = EndpointWriterMailbox(100, max_linger_us=200000)
+    mailbox.register_handlers(invoker, Dispatchers().default_dispatcher)
+    # pretend a steady 1000 messages per second were observed so far
+    for i in range(50):
+        mailbox._linger.flushed(10, i * 0.01)
+
+    for i in range(5):
+        mailbox.post_user_message(create_remote_deliver(i))
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.4)
+
+    assert sum(len(batch) for batch in invoker.user_messages) == 5
+    assert len(invoker.user_messages) < 5
@@ -0,0 +1,15 @@
+from protoactor.actor import PID
+from protoactor.remote.messages import Endpoint
+
+
+def test_endpoint_shards_targets_over_writers():
+    writers = [PID(address='local', id='writer%d' % i) for i in range(3)]
+    endpoint = Endpoint(PID(address='local', id='watcher'), writers)
+
+    targets = [PID(address='remote', id=str(i)) for i in range(30)]
+    used = {endpoint.writer_for(target).id for target in targets}
+
+    assert used == {writer.id for writer in writers}
+    for target in targets:
+        assert endpoint.writer_for(PID(address='remote', id=target.id)) == endpoint.writer_for(target)
+    assert endpoint.writer == writers[0]
@@ -1,4 +1,6 @@
 import asyncio
+import errno
+import socket
 import uuid
 from datetime import timedelta
 
@@ -10,7 +12,8 @@ from protoactor.actor.actor_context import RootContext, AbstractContext
 from protoactor.actor.messages import Started
 from protoactor.actor.props import Props
 from protoactor.actor.protos_pb2 import Unwatch, Terminated
-from protoactor.remote.remote import Remote
+from protoactor.actor.process import ProcessRegistry
+from protoactor.remote.remote import Remote, RemoteProcess, EndpointManager, parse_address, _remove_stale_socket
 from tests.remote.messages.protos_pb2 import Ping
 from tests.remote.remote_manager import RemoteManager
 
@@ -39,6 +42,76 @@ async def test_can_send_and_receive_to_existing_remote(remote_manager):
     assert "%s Hello" % remote_manager.default_node_address == pong.message
 
 
+@pytest.mark.asyncio
+async def test_can_send_and_receive_over_unix_domain_socket(remote_manager, tmp_path):
+    address, _ = remote_manager.provision_node('unix:%s' % (tmp_path / 'node.sock'), 0)
+    remote_actor = PID(address=address, id='EchoActorInstance')
+    pong = await root_context.request_future(remote_actor, Ping(message="Hello"), timeout=timedelta(seconds=5))
+    assert "%s:0 Hello" % address == pong.message
+
+
+@pytest.mark.asyncio
+async def test_can_send_and_receive_over_shared_memory(remote_manager):
+    address, _ = remote_manager.provision_node('shm://node-%s' % uuid.uuid4().hex, 0)
+    remote_actor = PID(address=address, id='EchoActorInstance')
+    for i in range(3):
+        pong = await root_context.request_future(remote_actor, Ping(message=str(i)), timeout=timedelta(seconds=5))
+        assert "%s:0 %s" % (address, i) == pong.message
+
+
+def test_parse_address():
+    assert parse_address('127.0.0.1:12000') == ('127.0.0.1', 12000, None)
+    assert parse_address('unix:/run/node.sock') == (None, None, '/run/node.sock')
+
+
+@pytest.mark.parametrize('address', ['127.0.0.1:12000', 'localhost:1', 'unix:/run/node.sock', 'unix:node.sock'])
+def test_parse_address_round_trips(address):
+    host, port, path = parse_address(address)
+    assert ('unix:%s' % path if path is not None else '%s:%s' % (host, port)) == address
+
+
+@pytest.mark.asyncio
+async def test_unix_address_reaches_endpoint_manager_unchanged_through_remote_process(remote_manager, monkeypatch):
+    delivered = []
+
+    async def remote_deliver(msg):
+        delivered.append(msg)
+
+    monkeypatch.setattr(EndpointManager(), 'remote_deliver', remote_deliver)
+    pid = PID(address='unix:/run/node-%s.sock' % uuid.uuid4().hex, id='echo')
+
+    process = ProcessRegistry().get(pid)
+    await process.send_user_message(pid, Ping(message='hello'))
+
+    assert isinstance(process, RemoteProcess)
+    assert delivered[0].target.address == pid.address
+    assert parse_address(delivered[0].target.address) == (None, None, pid.address[len('unix:'):])
+
+
+def test_stale_unix_socket_is_removed(tmp_path):
+    path = str(tmp_path / 'node.sock')
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    _remove_stale_socket(path)
+    assert not (tmp_path / 'node.sock').exists()
+
+
+def test_unix_socket_of_a_running_node_is_kept(tmp_path):
+    path = str(tmp_path / 'node.sock')
+    listening = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listening.bind(path)
+    listening.listen(1)
+    try:
+        with pytest.raises(OSError) as e:
+            _remove_stale_socket(path)
+        assert e.value.errno == errno.EADDRINUSE
+        assert (tmp_path / 'node.sock').exists()
+    finally:
+        listening.close()
+
+
 @pytest.mark.asyncio
 async def test_when_remote_actor_not_found_request_async_timesout(remote_manager):
     unknown_remote_actor = PID(address=remote_manager.default_node_address, id="doesn't exist")
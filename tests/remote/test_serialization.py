@@ -36,3 +36,18 @@ def test_can_serialize_and_deserialize_protobuf():
     deserialized = Serialization().deserialize(type_name, data, 0)
     assert deserialized.address == "123"
     assert deserialized.id == "456"
+
+
+def test_get_serializer_returns_type_name_and_serialize_function():
+    pid = PID(address='123', id='456')
+    type_name, serialize = Serialization().get_serializer(pid, 0)
+    assert type_name == "actor.PID"
+    assert serialize(pid) == pid.SerializeToString()
+    assert Serialization().get_serializer(PID(), 0) == (type_name, serialize)
+
+
+def test_get_serializer_falls_back_to_message_type_name_for_json_messages():
+    json = JsonMessage("remote_test_messages.Ping", "{ \"message\":\"Hello\"}")
+    type_name, serialize = Serialization().get_serializer(json, 1)
+    assert type_name == "remote_test_messages.Ping"
+    assert serialize(json) == b"{ \"message\":\"Hello\"}"
@@ -0,0 +1,161 @@
+import asyncio
+import errno
+import os
+import uuid
+from datetime import timedelta
+
+import pytest
+
+from protoactor.remote.protos_remote_pb2 import MessageBatch
+from protoactor.remote.shm_transport import ShmRing, ShmServer, ring_in_use
+
+
+@pytest.fixture
+def ring():
+    ring = ShmRing.create('test-%s' % uuid.uuid4().hex, 64, 0)
+    yield ring
+    ring.close()
+
+
+def test_written_records_are_read_in_order(ring):
+    writer = ShmRing.attach(ring._name)
+    try:
+        assert writer.write(b'first')
+        assert writer.write(b'second')
+        assert ring.read() == [b'first', b'second']
+        assert ring.read() == []
+    finally:
+        writer.close()
+
+
+def test_records_wrap_around_the_end_of_the_ring(ring):
+    writer = ShmRing.attach(ring._name)
+    try:
+        for i in range(10):
+            record = bytes([i]) * 20
+            assert writer.write(record)
+            assert ring.read() == [record]
+    finally:
+        writer.close()
+
+
+def test_write_returns_false_when_ring_is_full(ring):
+    writer = ShmRing.attach(ring._name)
+    try:
+        assert writer.write(b'x' * 40)
+        assert not writer.write(b'x' * 40)
+        ring.read()
+        assert writer.write(b'x' * 40)
+    finally:
+        writer.close()
+
+
+def test_record_larger_than_ring_is_rejected(ring):
+    writer = ShmRing.attach(ring._name)
+    try:
+        with pytest.raises(ValueError):
+            writer.write(b'x' * 64)
+    finally:
+        writer.close()
+
+
+def test_attach_exposes_serializer_id_of_reader():
+    ring = ShmRing.create('test-%s' % uuid.uuid4().hex, 64, 1)
+    writer = ShmRing.attach(ring._name)
+    try:
+        assert writer.serializer_id == 1
+    finally:
+        writer.close()
+        ring.close()
+
+
+def test_write_fails_once_reader_closed(ring):
+    writer = ShmRing.attach(ring._name)
+    ring.close()
+    try:
+        with pytest.raises(ConnectionResetError):
+            writer.write(b'x')
+    finally:
+        writer.close()
+
+
+def test_create_refuses_a_ring_with_a_running_reader(ring):
+    assert ring_in_use(ring._name)
+    with pytest.raises(OSError) as e:
+        ShmRing.create(ring._name, 64, 0)
+    assert e.value.errno == errno.EADDRINUSE
+
+
+def test_create_takes_over_a_ring_left_behind_by_a_reader():
+    stale = ShmRing.create('test-%s' % uuid.uuid4().hex, 64, 0)
+    # the reader exits without closing the ring
+    os.close(stale._fifo)
+    stale._buf.release()
+    stale._shm.close()
+    assert not ring_in_use(stale._name)
+
+    ring = ShmRing.create(stale._name, 64, 0)
+    try:
+        assert ring_in_use(ring._name)
+    finally:
+        ring.close()
+
+
+def test_attach_fails_without_reader():
+    with pytest.raises(FileNotFoundError):
+        ShmRing.attach('test-%s' % uuid.uuid4().hex)
+
+
+@pytest.mark.asyncio
+async def test_write_async_gives_up_when_ring_stays_full(ring):
+    writer = ShmRing.attach(ring._name)
+    try:
+        assert writer.write(b'x' * 40)
+        with pytest.raises(TimeoutError):
+            await writer.write_async(b'x' * 40, timedelta(seconds=0.05))
+    finally:
+        writer.close()
+
+
+class FakeEndpointReader:
+    def __init__(self):
+        self.suspended = False
+        self.batches = []
+
+    @staticmethod
+    def pid_cache():
+        return None
+
+    async def receive_batch(self, batch, pids):
+        if batch.target_names[0] == 'broken':
+            raise ValueError('broken batch')
+        self.batches.append(batch.target_names[0])
+
+
+async def serve(endpoint_reader, *target_names):
+    server = ShmServer(endpoint_reader, 'test-%s' % uuid.uuid4().hex, 1024, 0)
+    await server.start()
+    writer = ShmRing.attach(server._name)
+    try:
+        for target_name in target_names:
+            await writer.write_async(MessageBatch(target_names=[target_name]).SerializeToString())
+        await asyncio.sleep(0.05)
+    finally:
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_server_keeps_serving_after_a_failed_batch():
+    endpoint_reader = FakeEndpointReader()
+    await serve(endpoint_reader, 'first', 'broken', 'second')
+    assert endpoint_reader.batches == ['first', 'second']
+
+
+@pytest.mark.asyncio
+async def test_suspended_server_drops_batches():
+    endpoint_reader = FakeEndpointReader()
+    endpoint_reader.suspended = True
+    await serve(endpoint_reader, 'first')
+    assert endpoint_reader.batches == []
@@ -0,0 +1,106 @@
+import asyncio
+import multiprocessing
+import os
+import struct
+from datetime import timedelta
+
+import pytest
+
+from protoactor.actor.actor import Actor
+from protoactor.actor.actor_context import RootContext
+from protoactor.actor.process import ProcessRegistry
+from protoactor.actor.props import Props
+from protoactor.actor.protos_pb2 import PID
+from protoactor.remote.protos_remote_pb2 import MessageBatch
+from protoactor.remote.remote import Remote
+from protoactor.remote.response import ResponseStatusCode
+from protoactor.remote.serialization import Serialization
+from protoactor.remote.worker_pool import WorkerPool, WorkerLink
+from tests.remote.messages.protos_pb2 import Ping, Pong, DESCRIPTOR
+
+root_context = RootContext()
+
+
+class PidEchoActor(Actor):
+    async def receive(self, context):
+        if isinstance(context.message, Ping):
+            await context.respond(Pong(message='%s %s' % (os.getpid(), context.message.message)))
+
+
+def register_kinds():
+    Serialization().register_file_descriptor(DESCRIPTOR)
+    Remote().register_known_kind('PidEchoActor', Props.from_producer(PidEchoActor))
+
+
+@pytest.fixture(scope='module')
+def worker_pool():
+    Serialization().register_file_descriptor(DESCRIPTOR)
+    pool = WorkerPool(2, initializer=register_kinds)
+    pool.start(address='worker-0' if ProcessRegistry().address == 'nonhost' else None)
+    yield pool
+    pool.shutdown()
+
+
+def test_worker_addresses():
+    assert WorkerPool(3, name='cpu').addresses == ['cpu-1', 'cpu-2', 'cpu-3']
+
+
+def test_worker_count_must_be_positive():
+    with pytest.raises(ValueError):
+        WorkerPool(0)
+
+
+def test_start_requires_an_address_for_a_nonhost_node():
+    if ProcessRegistry().address != 'nonhost':
+        pytest.skip('Node already has an address')
+    with pytest.raises(ValueError):
+        WorkerPool(1).start()
+
+
+@pytest.mark.asyncio
+async def test_link_coalesces_queued_messages_into_one_batch():
+    Serialization().register_file_descriptor(DESCRIPTOR)
+    link_reader, peer_writer = multiprocessing.Pipe(duplex=False)
+    peer_reader, link_writer = multiprocessing.Pipe(duplex=False)
+    link = WorkerLink(link_reader, link_writer)
+    for i in range(100):
+        link.post(PID(address='worker-1', id='echo'), Ping(message=str(i)))
+
+    task = asyncio.ensure_future(link.run_async())
+    await asyncio.sleep(0.1)
+    frame = os.read(peer_reader.fileno(), 1 << 16)
+    peer_writer.close()
+    await asyncio.wait_for(task, 1)
+
+    length = struct.unpack_from('<I', frame)[0]
+    assert len(frame) == 4 + length
+    address, data = frame[4:].split(b'\n', 1)
+    batch = MessageBatch.FromString(data)
+    assert address == b'worker-1'
+    assert list(batch.target_names) == ['echo']
+    assert [Ping.FromString(envelope.message_data).message for envelope in batch.envelopes] == \
+           [str(i) for i in range(100)]
+
+
+@pytest.mark.asyncio
+async def test_can_spawn_actor_in_worker_process(worker_pool):
+    response = await worker_pool.spawn_named_async('worker-1', 'echo', 'PidEchoActor', timedelta(seconds=10))
+    assert response.status_code == ResponseStatusCode.OK.value
+    assert response.pid.address == 'worker-1'
+
+    pong = await root_context.request_future(response.pid, Ping(message='hello'), timeout=timedelta(seconds=5))
+    pid, message = pong.message.split(' ')
+    assert message == 'hello'
+    assert int(pid) != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_spawned_actors_are_spread_over_workers(worker_pool):
+    responses = [await worker_pool.spawn_async('PidEchoActor', timedelta(seconds=10)) for _ in range(2)]
+    assert {response.pid.address for response in responses} == set(worker_pool.addresses)
+
+    pids = set()
+    for response in responses:
+        pong = await root_context.request_future(response.pid, Ping(message='hello'), timeout=timedelta(seconds=5))
+        pids.add(pong.message.split(' ')[0])
+    assert len(pids) == 2
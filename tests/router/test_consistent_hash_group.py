@@ -6,6 +6,9 @@ import pytest
 from protoactor.actor.actor import Actor
 from protoactor.actor.actor_context import RootContext, AbstractContext
 from protoactor.actor.props import Props
+from protoactor.actor.protos_pb2 import PID
+from protoactor.router.consistent_hash_group_router import ConsistentHashRouterState
+from protoactor.router.hash import MD5Hasher
 from protoactor.router.messages import AbstractHashable, AddRoutee, RemoveRoutee, GetRoutees, BroadcastMessage
 from protoactor.router.router import Router
 
@@ -14,6 +17,23 @@ timeout = timedelta(milliseconds=1000)
 my_actor_props = Props.from_producer(lambda: MyTestActor())
 
 
+def test_set_routees_leaves_the_routing_snapshot_of_senders_unchanged():
+    routees = [PID(address='nonhost', id=name) for name in ('a', 'b', 'c')]
+    keys = [str(i) for i in range(100)]
+    state = ConsistentHashRouterState(MD5Hasher.hash, 100)
+    state.set_routees(routees)
+
+    # a sender routing while the routees change
+    hash_ring, routee_map = state._routing
+    nodes = hash_ring.nodes
+    state.set_routees(routees[:1])
+
+    assert hash_ring.nodes == nodes
+    assert all(hash_ring.get_node(key) in routee_map for key in keys)
+    hash_ring, routee_map = state._routing
+    assert {routee_map[hash_ring.get_node(key)].id for key in keys} == {'a'}
+
+
 @pytest.mark.asyncio
 async def test_consistent_hash_group_router_message_with_same_hash_always_goes_to_same_routee():
     router, routee1, routee2, routee3 = create_broadcast_group_router_with3_routees()
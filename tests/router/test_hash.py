@@ -0,0 +1,46 @@
+from protoactor.router.hash import HashRing, MD5Hasher
+
+
+def linear_get_node(nodes, replica_count, key):
+    ring = sorted(((MD5Hasher.hash(str(count) + node), node) for node in nodes for count in range(replica_count)),
+                  key=lambda tup: tup[0])
+    node = next((t for t in ring if t[0] > MD5Hasher.hash(key)), None)
+    return node[1] if node is not None else ring[0][1]
+
+
+def test_hash_ring_get_node_matches_linear_scan():
+    nodes = ['node%d' % i for i in range(5)]
+    ring = HashRing(nodes, MD5Hasher.hash, 20)
+
+    for i in range(200):
+        key = 'key%d' % i
+        assert ring.get_node(key) == linear_get_node(nodes, 20, key)
+
+
+def test_hash_ring_get_node_hashes_key_once_and_caches_result():
+    calls = []
+
+    def hash_func(key):
+        calls.append(key)
+        return MD5Hasher.hash(key)
+
+    ring = HashRing(['node1', 'node2'], hash_func, 10)
+    calls.clear()
+
+    node = ring.get_node('key')
+    assert ring.get_node('key') == node
+    assert calls == ['key']
+
+
+def test_hash_ring_add_and_remove_nodes_matches_rebuilt_ring():
+    ring = HashRing(['node1', 'node2'], MD5Hasher.hash, 20)
+    ring.get_node('key1')
+
+    ring.add_nodes(['node3', 'node4'])
+    ring.remove_nodes(['node1'])
+
+    rebuilt = HashRing(['node2', 'node3', 'node4'], MD5Hasher.hash, 20)
+    assert sorted(ring.nodes) == ['node2', 'node3', 'node4']
+    for i in range(200):
+        key = 'key%d' % i
+        assert ring.get_node(key) == rebuilt.get_node(key)
@@ -1,12 +1,20 @@
+import asyncio
 from datetime import timedelta
 
 import pytest
 
 from protoactor.actor.actor import Actor
 from protoactor.actor.actor_context import RootContext, AbstractContext
+from protoactor.actor.event_stream import GlobalEventStream
+from protoactor.actor.messages import DeadLetterEvent, PoisonPill
+from protoactor.actor.process import ProcessRegistry, DeadLettersProcess
 from protoactor.actor.props import Props
+from protoactor.actor.protos_pb2 import PID
+from protoactor.mailbox.mailbox import MailboxFactory, BoundedMailboxOverflowStrategy
 from protoactor.router.messages import RemoveRoutee, GetRoutees, AddRoutee, BroadcastMessage
+from protoactor.mailbox.dispatcher import CurrentLoopDispatcher
 from protoactor.router.router import Router
+from protoactor.router.router_process import RouterProcess
 from tests.test_fixtures.test_mailbox import MockMailbox
 
 context = RootContext()
@@ -14,6 +22,65 @@ timeout = timedelta(milliseconds=1000)
 my_actor_props = Props.from_producer(lambda: MyTestActor()).with_mailbox(MockMailbox)
 
 
+@pytest.mark.asyncio
+async def test_message_rejected_by_the_mailbox_of_a_starting_router_goes_to_dead_letters():
+    dead_letters = []
+
+    async def on_dead_letter(event):
+        dead_letters.append(event.message)
+
+    # the router actor never starts, so its process queues the messages in the mailbox
+    process = RouterProcess(None, MailboxFactory.create_bounded_mailbox(1))
+    subscription = GlobalEventStream.subscribe(on_dead_letter, DeadLetterEvent)
+    try:
+        await process.send_user_message(PID(address='nonhost', id='router'), '1')
+        await process.send_user_message(PID(address='nonhost', id='router'), '2')
+        assert dead_letters == ['2']
+    finally:
+        subscription.unsubscribe()
+
+
+@pytest.mark.asyncio
+async def test_dropped_messages_of_a_starting_router_release_their_senders():
+    process = RouterProcess(None, MailboxFactory.create_bounded_mailbox(
+        1, overflow_strategy=BoundedMailboxOverflowStrategy.DROP_OLDEST))
+    pid = PID(address='nonhost', id='router')
+
+    add_routee = asyncio.ensure_future(process.send_user_message(pid, AddRoutee(PID(address='nonhost', id='a'))))
+    await asyncio.sleep(0)
+    # drops the management message, then the first queued message
+    await process.send_user_message(pid, '1')
+    await process.send_user_message(pid, '2')
+
+    await asyncio.wait_for(add_routee, 1)
+    assert process._queued_messages == 1
+
+
+@pytest.mark.asyncio
+async def test_stopped_router_releases_senders_of_pending_management_messages():
+    process = RouterProcess(None, MailboxFactory.create_unbounded_mailbox())
+    pid = PID(address='nonhost', id='router')
+
+    add_routee = asyncio.ensure_future(process.send_user_message(pid, AddRoutee(PID(address='nonhost', id='a'))))
+    await asyncio.sleep(0)
+    process.stopped()
+
+    await asyncio.wait_for(add_routee, 1)
+
+
+@pytest.mark.asyncio
+async def test_poison_pill_stops_the_router_and_not_a_routee():
+    router, routee1, routee2, routee3 = create_router_with3_routees()
+    await context.request_future(router, GetRoutees(), timeout)
+
+    await context.send(router, PoisonPill())
+    await asyncio.sleep(0.1)
+
+    assert isinstance(ProcessRegistry().get(router), DeadLettersProcess)
+    for routee in (routee1, routee2, routee3):
+        assert not isinstance(ProcessRegistry().get(routee), DeadLettersProcess)
+
+
 @pytest.mark.asyncio
 async def test_round_robin_group_router_routees_receive_messages_in_round_robin_style():
     router, routee1, routee2, routee3 = create_router_with3_routees()
@@ -95,6 +162,46 @@ async def test_round_robin_group_router_all_routees_receive_router_broadcast_mes
     assert await context.request_future(routee3, 'received?', timeout) == 'hello'
 
 
+@pytest.mark.asyncio
+async def test_round_robin_group_router_routes_messages_without_the_router_mailbox():
+    routee1 = context.spawn(my_actor_props)
+    routee2 = context.spawn(my_actor_props)
+    mailbox = MockMailbox()
+    router = context.spawn(Router.new_round_robin_group([routee1, routee2]).with_mailbox(lambda: mailbox))
+
+    await context.send(router, '1')
+    await context.send(router, '2')
+
+    assert await context.request_future(routee1, 'received?', timeout) == '1'
+    assert await context.request_future(routee2, 'received?', timeout) == '2'
+    assert mailbox.user_messages == []
+
+    await context.send(router, RemoveRoutee(routee1))
+    assert len(mailbox.user_messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_round_robin_pool_spawn_does_not_wait_for_the_router_to_start():
+    received = []
+
+    async def receive(ctx):
+        if isinstance(ctx.message, int):
+            received.append(ctx.message)
+
+    # the router runs on the loop of this test, waiting for it to start in spawn would never return
+    props = Router.new_round_robin_pool(Props.from_func(receive), 2) \
+        .with_dispatcher(CurrentLoopDispatcher())
+    router = context.spawn(props)
+    for i in range(6):
+        await context.send(router, i)
+
+    routees = await context.request_future(router, GetRoutees(), timeout)
+    await asyncio.sleep(0.1)
+
+    assert len(routees.pids) == 2
+    assert sorted(received) == list(range(6))
+
+
 def create_router_with3_routees():
     routee1 = context.spawn(my_actor_props)
     routee2 = context.spawn(my_actor_props)
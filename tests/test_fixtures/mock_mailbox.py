@@ -10,7 +10,7 @@ class MockMailbox(DefaultMailbox):
 
     def post_user_message(self, msg):
         self.user_messages.append(msg)
-        super().post_user_message(msg)
+        return super().post_user_message(msg)
 
     def post_system_message(self, msg):
         self.system_messages.append(msg)
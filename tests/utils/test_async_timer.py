@@ -0,0 +1,105 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from protoactor.utils.async_timer import DeadlineTimer
+
+
+@pytest.mark.asyncio
+async def test_deadline_timer_fires_once():
+    fired = []
+
+    async def callback():
+        fired.append(True)
+
+    timer = DeadlineTimer(timedelta(milliseconds=20), callback)
+    timer.start()
+    await asyncio.sleep(0.1)
+
+    assert fired == [True]
+    assert timer.is_active is False
+
+
+@pytest.mark.asyncio
+async def test_deadline_timer_reset_moves_deadline():
+    fired = []
+
+    async def callback():
+        fired.append(True)
+
+    timer = DeadlineTimer(timedelta(milliseconds=50), callback)
+    timer.start()
+    for _ in range(4):
+        await asyncio.sleep(0.02)
+        timer.reset()
+    assert fired == []
+
+    await asyncio.sleep(0.1)
+    assert fired == [True]
+
+
+@pytest.mark.asyncio
+async def test_deadline_timer_cancel():
+    fired = []
+
+    async def callback():
+        fired.append(True)
+
+    timer = DeadlineTimer(timedelta(milliseconds=20), callback)
+    timer.start()
+    timer.cancel()
+    await asyncio.sleep(0.05)
+
+    assert fired == []
+
+
+@pytest.mark.asyncio
+async def test_deadline_timer_reset_with_shorter_interval_fires_earlier():
+    fired = []
+
+    async def callback():
+        fired.append(True)
+
+    timer = DeadlineTimer(timedelta(seconds=2), callback)
+    timer.start()
+    timer.interval = timedelta(milliseconds=20)
+    timer.reset()
+    await asyncio.sleep(0.1)
+
+    assert fired == [True]
+
+
+@pytest.mark.asyncio
+async def test_deadline_timer_cancel_removes_scheduled_callback():
+    timer = DeadlineTimer(timedelta(seconds=2), asyncio.sleep, [0])
+    timer.start()
+    handle = timer._handle
+    timer.cancel()
+
+    assert handle.cancelled()
+    assert timer._handle is None
+
+
+@pytest.mark.asyncio
+async def test_deadline_timer_pause_and_reset_keep_the_scheduled_callback():
+    fired = []
+
+    async def callback():
+        fired.append(True)
+
+    timer = DeadlineTimer(timedelta(milliseconds=50), callback)
+    timer.start()
+    handle = timer._handle
+    for _ in range(100):
+        timer.pause()
+        timer.reset()
+    assert timer._handle is handle
+
+    timer.pause()
+    await asyncio.sleep(0.1)
+    assert fired == []
+
+    timer.reset()
+    await asyncio.sleep(0.1)
+    assert fired == [True]